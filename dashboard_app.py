@@ -3,27 +3,89 @@ CampaignIQ Interactive Dashboard
 Run with: streamlit run dashboard_app.py
 """
 
-import json
+import os
+from pathlib import Path
+import orjson
 import pandas as pd
+import streamlit as st
 from src.agents.dashboard_generator import DashboardGeneratorAgent
 
-def main():
-    # Load all Data
-    processed_data = pd.read_csv('data/processed/campaign_data_processed.csv')
-    processed_data['date'] = pd.to_datetime(processed_data['date'])
+RAW_DATA_PATH = 'data/raw/baliglow_campaign_data.csv'
+PROCESSED_DATA_PATH = 'data/processed/campaign_data_processed.parquet'
+PERFORMANCE_ANALYSIS_PATH = 'data/processed/performance_analysis.json'
+INSIGHTS_PATH = 'data/processed/insights.json'
+
+# Parquet tables exported by PerformanceAnalyzerAgent.save_analysis
+ANALYSIS_TABLE_PATHS = {
+    'weekly_analysis': 'data/processed/weekly_analysis.parquet',
+    'platform_analysis': 'data/processed/platform_analysis.parquet',
+    'creative_analysis': 'data/processed/creative_analysis.parquet'
+}
+
+# Top-level analysis sections read by DashboardGeneratorAgent
+DASHBOARD_ANALYSIS_KEYS = (
+    'overall_kpis',
+    'platform_analysis',
+    'best_platform_by_ctr',
+    'weekly_analysis',
+    'creative_analysis',
+    'data_quality'
+)
+
+# Loaders are cached across Streamlit reruns; mtime is part of the key so
+# regenerated files invalidate the cache.
+@st.cache_data(show_spinner=False)
+def _load_processed(path: str, mtime: float) -> pd.DataFrame:
+    """Load processed campaign data from Parquet (date is already datetime64)."""
+    df = pd.read_parquet(path, engine='pyarrow')
+    return df.astype({'platform': 'category', 'creative_id': 'category'})
 
-    with open('data/processed/performance_analysis.json', 'r') as f:
-        performance_analysis = json.load(f)
-    
+@st.cache_data(show_spinner=False)
+def _ingest(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Run Agent 1 on the raw CSV, for when no processed Parquet exists yet.
+    Streamlit hands each rerun its own copy, so the result is safe to mutate.
+    """
+    from src.agents.data_ingestion import DataIngestionAgent
+    processed_data, _ = DataIngestionAgent(path).run()
+    return processed_data.astype({'platform': 'category', 'creative_id': 'category'})
 
-    with open('data/processed/insights.json', 'r') as f:
-        insight = json.load(f)
+@st.cache_data(show_spinner=False)
+def _load_table(path: str, mtime: float) -> pd.DataFrame:
+    """Load an analysis table from Parquet."""
+    return pd.read_parquet(path, engine='pyarrow')
+
+@st.cache_data(show_spinner=False)
+def _load_perf(path: str, mtime: float) -> dict:
+    """Load performance analysis JSON and keep only the sections the dashboard uses."""
+    analysis = orjson.loads(Path(path).read_bytes())
+    return {key: analysis[key] for key in DASHBOARD_ANALYSIS_KEYS if key in analysis}
+
+@st.cache_data(show_spinner=False)
+def _load_insights(path: str, mtime: float) -> dict:
+    """Load AI insights from JSON."""
+    return orjson.loads(Path(path).read_bytes())
+
+def main():
+    # Load all Data
+    if os.path.exists(PROCESSED_DATA_PATH):
+        processed_data = _load_processed(PROCESSED_DATA_PATH, os.path.getmtime(PROCESSED_DATA_PATH))
+    else:
+        processed_data = _ingest(RAW_DATA_PATH, os.path.getmtime(RAW_DATA_PATH))
+    performance_analysis = _load_perf(PERFORMANCE_ANALYSIS_PATH, os.path.getmtime(PERFORMANCE_ANALYSIS_PATH))
+    insight = _load_insights(INSIGHTS_PATH, os.path.getmtime(INSIGHTS_PATH))
+    analysis_tables = {
+        key: _load_table(path, os.path.getmtime(path))
+        for key, path in ANALYSIS_TABLE_PATHS.items()
+        if os.path.exists(path)
+    }
 
     # Initialize and build dashboard
     dashboard = DashboardGeneratorAgent(
         performance_analysis=performance_analysis,
         insights=insight,
-        processed_data=processed_data
+        processed_data=processed_data,
+        analysis_tables=analysis_tables
     )
 
     dashboard.build_dashboard()
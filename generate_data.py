@@ -22,29 +22,35 @@ def main():
     print("📈 DATA SUMMARY")
     print("=" * 60)
     print(f"\nTotal rows: {len(df)}")
-    print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"Platforms: {df['platform'].unique().tolist()}")
-    print(f"Creatives per platform: {df.groupby('platform')['creative_id'].nunique().to_dict()}")
+    print(f"Date range: {df['date'].min():%Y-%m-%d} to {df['date'].max():%Y-%m-%d}")
+    # One grouped pass feeds the platform, budget and performance summaries
+    platform_summary = df.groupby('platform', sort=False, observed=True).agg(
+        creatives=('creative_id', 'nunique'),
+        spend=('spend', 'sum'),
+        impressions=('impressions', 'sum'),
+        clicks=('clicks', 'sum'),
+        cpm=('cpm', 'mean'),
+        ctr=('ctr', 'mean'),
+        engagement_rate=('engagement_rate', 'mean')
+    )
+    print(f"Platforms: {platform_summary.index.tolist()}")
+    print(f"Creatives per platform: {platform_summary['creatives'].to_dict()}")
     
     print("\n💰 BUDGET SUMMARY")
     print("-" * 60)
-    total_spend = df['spend'].sum()
+    spend_by_platform = platform_summary['spend']
+    total_spend = spend_by_platform.sum()
+    percentages = spend_by_platform / total_spend * 100
     print(f"Total spend: ${total_spend:,.2f}")
-    for platform in df['platform'].unique():
-        platform_spend = df[df['platform'] == platform]['spend'].sum()
-        percentage = (platform_spend / total_spend) * 100
-        print(f"  {platform}: ${platform_spend:,.2f} ({percentage:.1f}%)")
+    for platform, platform_spend in spend_by_platform.items():
+        print(f"  {platform}: ${platform_spend:,.2f} ({percentages[platform]:.1f}%)")
     
     print("\n📊 PERFORMANCE SUMMARY")
     print("-" * 60)
-    summary_stats = df.groupby('platform').agg({
-        'impressions': 'sum',
-        'clicks': 'sum',
-        'cpm': 'mean',
-        'ctr': 'mean',
-        'engagement_rate': 'mean'
-    }).round(4)
-    print(summary_stats)
+    summary_stats = platform_summary[
+        ['impressions', 'clicks', 'cpm', 'ctr', 'engagement_rate']
+    ].round(4)
+    print(summary_stats.to_string())
     
     # Display sample rows
     print("\n📋 SAMPLE DATA (first 5 rows)")
@@ -1,21 +1,143 @@
 """
 Agent 5: Dashboard Generator Agent
 Directly builds an interactive Streamlit dashboard from campaign analysis and insights.
+Plotly is imported where figures are built, so importing this module stays cheap.
 """
 
+import orjson
 import streamlit as st 
-import plotly.express as px 
-import plotly.graph_objects as go 
+import numpy as np
 import pandas as pd 
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 
+# Shared chart styling so every figure gets the same layout
+CHART_TEMPLATE = "plotly_dark"
+TREND_LAYOUT = dict(template=CHART_TEMPLATE, height=400)
+PLATFORM_COLOR_SEQUENCE = ['#00d4ff', '#ff6b6b', '#51cf66']
+PLATFORM_COLOR_MAP = {
+    'Google Display': '#00d4ff',
+    'Meta': '#ff6b6b',
+    'Tiktok': '#51cf66'
+}
+
+# Line charts switch to WebGL above this many points; SVG is faster for small series
+WEBGL_MIN_ROWS = 1000
+# Line series longer than this are downsampled (LTTB) before plotting
+MAX_LINE_POINTS = 2000
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick row positions to keep with Largest-Triangle-Three-Buckets.
+    Points are treated as evenly spaced on x, which holds for our time series.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    bucket_size = (n - 2) / (n_out - 2)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    return indices
+
+def _downsample(df: pd.DataFrame, y: str, n_out: int = MAX_LINE_POINTS) -> pd.DataFrame:
+    """Downsample a line-chart frame to at most n_out rows, keeping its visual shape."""
+    if len(df) <= n_out:
+        return df
+    return df.iloc[_lttb_indices(df[y].to_numpy(), n_out)]
+
+def _frame_hash(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a chart frame: shape, columns and hashed values."""
+    return (df.shape, tuple(df.columns), pd.util.hash_pandas_object(df, index=False).values.tobytes())
+
+FRAME_HASH_FUNCS = {pd.DataFrame: _frame_hash}
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+def _px_figure_json(kind: str, df: pd.DataFrame, layout: Dict = None, traces: Dict = None, **kwargs) -> str:
+    """
+    Build a Plotly Express figure and return it serialized as JSON.
+    Cached on the input frame and arguments, so reruns skip figure assembly.
+    """
+    import plotly.express as px
+
+    fig = getattr(px, kind)(df, template=CHART_TEMPLATE, **kwargs)
+    if layout:
+        fig.update_layout(**layout)
+    if traces:
+        fig.update_traces(**traces)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+def _ctr_trend_figure_json(df_weekly: pd.DataFrame, use_webgl: bool) -> str:
+    """Build the weekly CTR trend figure and return it serialized as JSON."""
+    import plotly.graph_objects as go
+
+    scatter = go.Scattergl if use_webgl else go.Scatter
+    fig = go.Figure()
+    fig.add_trace(scatter(
+        x=df_weekly['Week'],
+        y=df_weekly['CTR'],
+        mode='lines+markers',
+        name='CTR',
+        line=dict(color='#00d4ff', width=3),
+        marker=dict(size=10)
+    ))
+    fig.update_layout(
+        xaxis_title="Week",
+        yaxis_title="CTR (%)",
+        hovermode='x unified',
+        **TREND_LAYOUT
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+def _cpc_figure_json(df_platforms: pd.DataFrame) -> str:
+    """Build the platform cost-per-click figure and return it serialized as JSON."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='CPC',
+        x=df_platforms['Platform'],
+        y=df_platforms['CPC ($)'],
+        marker_color='#ff6b6b'
+    ))
+    fig.update_layout(
+        yaxis_title="Cost Per Click ($)",
+        **TREND_LAYOUT
+    )
+    return fig.to_json()
+
+def _plot_json(fig_json: str):
+    """Display a figure produced by one of the cached *_figure_json builders."""
+    st.plotly_chart(orjson.loads(fig_json), use_container_width=True)
+
 class DashboardGeneratorAgent:
     """
     Agent that directly builds and displays an interactive Streamlit dashboard.
     Visualizes campaign performance, trends, and AI-generated insights.
     """
-    def __init__(self, performance_analysis: Dict, insights: Dict, processed_data: pd.DataFrame):
+    def __init__(self, performance_analysis: Dict, insights: Dict, processed_data: pd.DataFrame,
+                 analysis_tables: Optional[Dict[str, pd.DataFrame]] = None):
         """
         Initialize Dashboard Generator Agent.
         
@@ -23,10 +145,87 @@ class DashboardGeneratorAgent:
             performance_analysis: Complete analysis from Agent 2
             insights: AI-generated insights from Agent 3
             processed_data: Processed campaign data from Agent 1
+            analysis_tables: Optional Parquet tables exported by Agent 2, keyed by
+                analysis section (e.g. 'weekly_analysis')
         """
         self.analysis = performance_analysis
         self.insights = insights
         self.data = processed_data
+        self.analysis_tables = analysis_tables or {}
+
+        # Build chart frames once so reruns don't rebuild them per tab
+        self.df_weekly = self._build_weekly_frame()
+        self.df_platforms = self._build_platform_frame()
+        self.df_creatives = self._build_creative_frame()
+
+        # Format KPI card values once; reruns only look them up
+        overall = self.analysis['overall_kpis']
+        self._kpi = {
+            'total_impressions': f"{overall['total_impressions']:,}",
+            'total_clicks': f"{overall['total_clicks']:,}",
+            'total_spend': f"{overall['total_spend']:,.2f}",
+            'average_ctr': f"{overall['average_ctr']:.2%}",
+            'average_cpm': f"${overall['average_cpm']:.2f}",
+            'cost_per_click': f"${overall['cost_per_click']:.2f}",
+            'total_reach': f"{overall['total_reach']:,}",
+            'frequency': f"{overall['frequency']:.2f}"
+        }
+
+    def _analysis_frame(self, key: str) -> pd.DataFrame:
+        """Return an analysis section as a frame, preferring Agent 2's Parquet export."""
+        if key in self.analysis_tables:
+            return self.analysis_tables[key]
+        return pd.DataFrame.from_dict(self.analysis[key], orient='index')
+
+    @staticmethod
+    def _to_percent(rates: pd.Series) -> np.ndarray:
+        """Scale a rate column to display percentages as float32."""
+        return (rates.to_numpy(dtype=np.float64) * 100.0).astype(np.float32)
+
+    @staticmethod
+    def _platform_label(platform: str) -> str:
+        """Turn a platform key like 'google_display' into 'Google Display'."""
+        return platform.replace('_', ' ').title()
+
+    def _build_weekly_frame(self) -> pd.DataFrame:
+        """Build weekly trend table from weekly analysis."""
+        # Order by the numeric week; the week_N index sorts week_10 before week_2
+        df = self._analysis_frame('weekly_analysis').sort_values('week_number', kind='stable')
+        return pd.DataFrame({
+            'Week': 'Week ' + df['week_number'].astype(str),
+            'CTR': self._to_percent(df['avg_ctr']),
+            'CPM': df['avg_cpm'],
+            'Engagement Rate': self._to_percent(df['avg_engagement_rate']),
+            'Spend': df['spend']
+        }).reset_index(drop=True)
+
+    def _build_platform_frame(self) -> pd.DataFrame:
+        """Build platform comparison table from platform analysis."""
+        df = self._analysis_frame('platform_analysis')
+        return pd.DataFrame({
+            'Platform': df.index.map(self._platform_label),
+            'Impressions': df['impressions'],
+            'Clicks': df['clicks'],
+            'CTR (%)': self._to_percent(df['avg_ctr']),
+            'CPM ($)': df['avg_cpm'],
+            'CPC ($)': df['cost_per_click'],
+            'Spend ($)': df['spend'],
+            'Engagement Rate (%)': self._to_percent(df['avg_engagement_rate'])
+        }).reset_index(drop=True)
+
+    def _build_creative_frame(self) -> pd.DataFrame:
+        """Build creative performance table from creative analysis."""
+        df = self._analysis_frame('creative_analysis')
+        rank = df['rank_by_ctr'].fillna(0).astype(int) if 'rank_by_ctr' in df else 0
+        return pd.DataFrame({
+            'Creative': df.index,
+            'Platform': df['platform'].astype('category').cat.rename_categories(self._platform_label),
+            'CTR (%)': self._to_percent(df['avg_ctr']),
+            'CPM ($)': df['avg_cpm'],
+            'Clicks': df['clicks'],
+            'Spend ($)': df['spend'],
+            'Renk': rank
+        }).reset_index(drop=True)
 
     def build_dashboard(self):
         """Build and display the complete Streamlit dashboard."""
@@ -75,7 +274,8 @@ class DashboardGeneratorAgent:
         # Executive Summary (KPI Cards)
         self._render_kpi_cards()
 
-        # Main content in tabs
+        # Main content in tabs; each tab renderer is a fragment, so widget
+        # interactions rerun only that tab
         tab1, tab2, tab3, tab4 = st.tabs([
             "📈 Performance Trends", 
             "🎯 Platform Analysis", 
@@ -110,41 +310,46 @@ class DashboardGeneratorAgent:
             end = date_range.get('end', 'N/A')
             st.metric("Campaign Duration", f"{overall['campaign_days']} days")
             st.caption(f"📅 {start} to {end}")
+            # Precomputed by the Performance Analyzer (missing in older analysis files)
+            best_platform = self.analysis.get('best_platform_by_ctr')
+            if best_platform:
+                best_ctr = self.analysis['platform_analysis'][best_platform]['avg_ctr']
+                st.caption(f"🏆 Best CTR: {best_platform} ({best_ctr:.2%})")
     
     def _render_kpi_cards(self):
         """Render KPI metrics cards."""
         st.markdown("---")
         st.subheader("📊 Executive Summary")
 
-        overall = self.analysis['overall_kpis']
+        kpi = self._kpi
 
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
             st.metric(
                 "Total Impressions",
-                f"{overall['total_impressions']:,}",
+                kpi['total_impressions'],
                 help="Total number of times ads were displayed"
             )
         
         with col2:
             st.metric(
                 "Total Clicks",
-                f"{overall['total_clicks']:,}",
+                kpi['total_clicks'],
                 help="Total clicks across all platforms"
             )
         
         with col3:
             st.metric(
                 "Total Spend",
-                f"{overall['total_spend']:,.2f}",
+                kpi['total_spend'],
                 help="Total campaign budget spent"
             )
 
         with col4:
             st.metric(
                 "Average CTR",
-                f"{overall['average_ctr']:.2%}",
+                kpi['average_ctr'],
                 help="Average click-through rate"
             )
 
@@ -154,263 +359,188 @@ class DashboardGeneratorAgent:
         with col5:
             st.metric(
                 "Average CPM",
-                f"${overall['average_cpm']:.2f}",
+                kpi['average_cpm'],
                 help="Average cost per thousand impressions"
             )
         
         with col6:
             st.metric(
                 "Cost Per Click",
-                f"${overall['cost_per_click']:.2f}",
+                kpi['cost_per_click'],
                 help="Average cost per click"
             )
         
         with col7:
             st.metric(
                 "Total Reach",
-                f"{overall['total_reach']:,}",
+                kpi['total_reach'],
                 help="Unique users reached"
             )
         
         with col8:
             st.metric(
                 "Frequency",
-                f"{overall['frequency']:.2f}",
+                kpi['frequency'],
                 help="Average times each user saw ads"
             )
     
+    @st.fragment
     def _render_performance_trends(self):
         """Render weekly performance trends."""
         st.markdown("### 📈 Week-over-Week Performance")
 
-        # Prepare weekly data
-        weekly_data = []
-        for week_key, week_data in sorted(self.analysis['weekly_analysis'].items()):
-            weekly_data.append({
-                'Week': f"Week {week_data['week_number']}",
-                'CTR': week_data['avg_ctr'] * 100,
-                'CPM': week_data['avg_cpm'],
-                'Engagement Rate': week_data['avg_engagement_rate'] * 100,
-                'Spend': week_data['spend']
-            })
-        df_weekly = pd.DataFrame(weekly_data)
+        df_weekly = self.df_weekly
+        use_webgl = len(df_weekly) > WEBGL_MIN_ROWS
 
         # CTR Trend Chart
         st.markdown('#### Click-Through Rate Trend')
-        fig_ctr = go.Figure()
-        fig_ctr.add_trace(go.Scatter(
-            x=df_weekly['Week'],
-            y=df_weekly['CTR'],
-            mode='lines+markers',
-            name='CTR',
-            line=dict(color='#00d4ff', width=3),
-            marker=dict(size=10)
-        ))
-        fig_ctr.update_layout(
-            xaxis_title="Week",
-            yaxis_title="CTR (%)",
-            template="plotly_dark",
-            height=400,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig_ctr, use_container_width=True)
+        _plot_json(_ctr_trend_figure_json(_downsample(df_weekly, 'CTR'), use_webgl))
 
         # CPM and Spend trends
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown('#### CPM Trend')
-            fig_cpm = px.line(
-                df_weekly,
+            _plot_json(_px_figure_json(
+                'line',
+                _downsample(df_weekly, 'CPM'),
+                traces=dict(line_color='#ff6b6b'),
                 x='Week',
                 y='CPM',
                 markers=True,
-                template="plotly_dark"
-            )
-            fig_cpm.update_traces(line_color='#ff6b6b')
-            st.plotly_chart(fig_cpm, use_container_width=True)
+                render_mode='webgl' if use_webgl else 'svg'
+            ))
 
         with col2:
             st.markdown('#### Weekly Spend')
-            fig_spend = px.bar(
+            _plot_json(_px_figure_json(
+                'bar',
                 df_weekly,
+                traces=dict(marker_color='#51cf66'),
                 x='Week',
-                y='Spend',
-                template="plotly_dark"
-            )
-            fig_spend.update_traces(marker_color='#51cf66')
-            st.plotly_chart(fig_spend, use_container_width=True)
+                y='Spend'
+            ))
         
         # Weekly data table
         with st.expander("📋 View Detailed Weekly Data"):
             st.dataframe(df_weekly, use_container_width=True)
     
+    @st.fragment
     def _render_platform_analysis(self):
         """Render platform comparison analysis"""
         st.markdown("### 🎯 Platform Performance Comparison")
 
-        # Prepare platform data
-        platform_data = []
-        for platform, metrics in self.analysis['platform_analysis'].items():
-            platform_data.append({
-                'Platform': platform.replace('_', ' ').title(),
-                'Impressions': metrics['impressions'],
-                'Clicks': metrics['clicks'],
-                'CTR (%)': metrics['avg_ctr']*100,
-                'CPM ($)': metrics['avg_cpm'],
-                'CPC ($)': metrics['cost_per_click'],
-                'Spend ($)': metrics['spend'],
-                'Engagement Rate (%)': metrics['avg_engagement_rate'] * 100
-            })
-        
-        df_platforms = pd.DataFrame(platform_data)
+        df_platforms = self.df_platforms
 
         # Platform comparison charts
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("#### CTR by Platform")
-            fig_ctr = px.bar(
+            _plot_json(_px_figure_json(
+                'bar',
                 df_platforms,
+                layout=dict(showlegend=False),
                 x='Platform',
                 y='CTR (%)',
                 color='Platform',
-                template="plotly_dark",
-                color_discrete_sequence=['#00d4ff', '#ff6b6b', '#51cf66']
-            )
-            fig_ctr.update_layout(showlegend=False)
-            st.plotly_chart(fig_ctr, use_container_width=True)
+                color_discrete_sequence=PLATFORM_COLOR_SEQUENCE
+            ))
         
         with col2:
             st.markdown("#### CPM by Platform")
-            fig_cpm = px.bar(
+            _plot_json(_px_figure_json(
+                'bar',
                 df_platforms,
+                layout=dict(showlegend=False),
                 x='Platform',
                 y='CPM ($)',
                 color='Platform',
-                template="plotly_dark",
-                color_discrete_sequence=['#00d4ff', '#ff6b6b', '#51cf66']
-            )
-            fig_cpm.update_layout(showlegend=False)
-            st.plotly_chart(fig_cpm, use_container_width=True)
+                color_discrete_sequence=PLATFORM_COLOR_SEQUENCE
+            ))
         
         # Cost efficiency comparison
         st.markdown('#### Cost Efficiency Comparison')
-        fig_efficiency = go.Figure()
-        fig_efficiency.add_trace(go.Bar(
-            name='CPC',
-            x=df_platforms['Platform'],
-            y=df_platforms['CPC ($)'],
-            marker_color='#ff6b6b'
-        ))
-        fig_efficiency.update_layout(
-            yaxis_title="Cost Per Click ($)",
-            template="plotly_dark",
-            height=400
-        )
-        st.plotly_chart(fig_efficiency, use_container_width=True)
+        _plot_json(_cpc_figure_json(df_platforms))
 
         # Budget allocation
         st.markdown("#### Budget Allocation")
-        fig_budget = px.pie(
+        _plot_json(_px_figure_json(
+            'pie',
             df_platforms,
             values='Spend ($)',
             names='Platform',
-            template="plotly_dark",
-            color_discrete_sequence=['#00d4ff', '#ff6b6b', '#51cf66']
-        )
-        st.plotly_chart(fig_budget, use_container_width=True)
+            color_discrete_sequence=PLATFORM_COLOR_SEQUENCE
+        ))
 
         # Platfrom metrics table
         with st.expander("📋 View Detailed Platform Metrics"):
             st.dataframe(df_platforms, use_container_width=True)
 
+    @st.fragment
     def _render_creative_performance(self):
         """Render creative performance analysis."""
         st.markdown("### 🎨 Creative Performance Rankings")
 
-        # Prepare creative data
-        creative_data = []
-        for creative_id, metrics in self.analysis['creative_analysis'].items():
-            creative_data.append({
-                'Creative': creative_id,
-                'Platform': metrics['platform'].replace('_', ' ').title(),
-                'CTR (%)': metrics['avg_ctr']*100,
-                'CPM ($)': metrics['avg_cpm'],
-                'Clicks': metrics['clicks'],
-                'Spend ($)': metrics['spend'],
-                'Renk': metrics.get('rank_by_ctr', 0)
-            })
-        
-        df_creatives = pd.DataFrame(creative_data)
-        df_creatives = df_creatives.sort_values('CTR (%)', ascending=False)
+        df_creatives = self.df_creatives
 
         # Top performers
         st.markdown("#### 🏆 Top Performing Creatives")
-        top_creatives = df_creatives.head(5)
+        top_creatives = df_creatives.nlargest(5, 'CTR (%)')
 
-        fig_top = px.bar(
+        _plot_json(_px_figure_json(
+            'bar',
             top_creatives,
             x='Creative',
             y='CTR (%)',
             color='Platform',
-            template="plotly_dark",
-            color_discrete_map={
-                'Google Display': '#00d4ff',
-                'Meta': '#ff6b6b',
-                'Tiktok': '#51cf66'
-            }
-        )
-        st.plotly_chart(fig_top, use_container_width=True)
+            color_discrete_map=PLATFORM_COLOR_MAP
+        ))
 
         # Bottom performers
         st.markdown("#### ⚠️ Underperforming Creatives")
-        bottom_creatives = df_creatives.tail(5)
+        # Worst five, kept in descending CTR order like the top chart
+        bottom_creatives = df_creatives.nsmallest(5, 'CTR (%)').iloc[::-1]
 
-        fig_bottom = px.bar(
+        _plot_json(_px_figure_json(
+            'bar',
             bottom_creatives,
             x='Creative',
             y='CTR (%)',
             color='Platform',
-            template="plotly_dark",
-            color_discrete_map={
-                'Google Display': '#00d4ff',
-                'Meta': '#ff6b6b',
-                'Tiktok': '#51cf66'
-            }
-        )
-        st.plotly_chart(fig_bottom, use_container_width=True)
+            color_discrete_map=PLATFORM_COLOR_MAP
+        ))
 
-        # Creative comparison by platform
+        # Creative comparison by platform (split once instead of masking per platform)
+        platform_groups = dict(tuple(df_creatives.groupby('Platform', sort=False, observed=True)))
         for platform in df_creatives['Platform'].unique():
-            platform_creatives = df_creatives[df_creatives['Platform']==platform]
+            platform_creatives = platform_groups[platform]
             
             with st.expander(f"📊 {platform} Creative Breakdown"):
                 col1, col2 = st.columns(2)
 
                 with col1:
                     st.markdown("**CTR Comparison**")
-                    fig = px.bar(
+                    _plot_json(_px_figure_json(
+                        'bar',
                         platform_creatives,
                         x='Creative',
-                        y='CTR (%)',
-                        template="plotly_dark"
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                        y='CTR (%)'
+                    ))
                 
                 with col2:
                     st.markdown("**Spend Distribution**")
-                    fig = px.pie(
+                    _plot_json(_px_figure_json(
+                        'pie',
                         platform_creatives,
                         values='Spend ($)',
-                        names='Creative',
-                        template="plotly_dark"
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                        names='Creative'
+                    ))
         
         with st.expander("📋 View All Creative Performance Data"):
             st.dataframe(df_creatives, use_container_width=True)
 
+    @st.fragment
     def _render_ai_insights(self):
         """Render AI-generated insights and recommendations."""
         st.markdown("### 💡 AI-Powered Insights & Recommendations")
@@ -420,6 +550,8 @@ class DashboardGeneratorAgent:
 
         priority_recs = self.insights.get('priority_recommendations', [])
         if priority_recs:
+            # Collect every card and emit them in a single markdown element
+            rec_cards = []
             for rec in priority_recs:
                 rank = rec.get('rank', '?')
                 insight = rec.get('insight', rec.get('recommendation', 'N/A'))
@@ -438,7 +570,7 @@ class DashboardGeneratorAgent:
                     border_color = '#00d4ff'
                     urgency_emoji = '🟢'
                 
-                st.markdown(f"""
+                rec_cards.append(f"""
                 <div style="background-color: #1e1e1e; padding: 20px; border-radius: 10px; 
                             border-left: 5px solid {border_color}; margin: 15px 0;">
                     <h4 style="color: {border_color};">#{rank} {urgency_emoji} {insight}</h4>
@@ -446,7 +578,8 @@ class DashboardGeneratorAgent:
                     <p><strong>💰 Impact:</strong> {impact}</p>
                     <p><strong>⏰ Urgency:</strong> {urgency}</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+            st.markdown("".join(rec_cards), unsafe_allow_html=True)
         else:
             st.info("No priority recommendations available")
         
@@ -480,10 +613,12 @@ class DashboardGeneratorAgent:
                         priority = insight.get('priority', 'medium').upper()
 
                         with st.expander(f"Insight {i}: {insight_text[:60]}..."):
-                            st.markdown(f"**📊 Finding:** {insight_text}")
-                            st.markdown(f"**💼 Impact:** {impact}")
-                            st.markdown(f"**✅ Recommendation:** {recommendation}")
-                            st.markdown(f"**⚡ Priority:** {priority}")
+                            st.markdown(
+                                f"**📊 Finding:** {insight_text}\n\n"
+                                f"**💼 Impact:** {impact}\n\n"
+                                f"**✅ Recommendation:** {recommendation}\n\n"
+                                f"**⚡ Priority:** {priority}"
+                            )
                 else:
                     st.info(f"No {category_key.replace('_', ' ')} insights available")
     
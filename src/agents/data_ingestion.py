@@ -7,7 +7,43 @@ import numpy as np
 import pandas as pd 
 from datetime import datetime 
 from typing import Dict, List, Tuple
-import json
+import orjson
+
+# Display names for the raw platform keys
+PLATFORM_DISPLAY_NAMES = {
+    'google_display':'Google Display',
+    'meta':'Meta',
+    'tiktok':'TikTok'
+}
+
+# Weekday labels indexed by DatetimeIndex.dayofweek (Monday=0)
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Raw CSV schema, so read_csv parses straight into compact dtypes
+RAW_DTYPES = {
+    'campaign_id': 'category',
+    'campaign_name': 'category',
+    'brand_name': 'category',
+    'platform': 'category',
+    'creative_id': 'category',
+    'impressions': 'int32',
+    'reach': 'int32',
+    'clicks': 'int32',
+    'spend': 'float64',
+    'engagements': 'int32',
+    'video_views': 'int32',
+    'cpm': 'float32',
+    'ctr': 'float32',
+    'engagement_rate': 'float32'
+}
+RAW_COLUMNS = ['date', *RAW_DTYPES]
+
+def read_raw_csv(path: str) -> pd.DataFrame:
+    """Parse the raw campaign CSV into RAW_DTYPES, with date parsed at read time."""
+    return pd.read_csv(
+        path, usecols=RAW_COLUMNS, dtype=RAW_DTYPES, parse_dates=['date'],
+        engine='c', memory_map=True
+    )
 
 class DataIngestionAgent:
     """
@@ -31,7 +67,7 @@ class DataIngestionAgent:
         """Load campaign data from CSV."""
         print("📥 Loading campaign data ...")
         try:
-            self.raw_data = pd.read_csv(self.data_path)
+            self.raw_data = read_raw_csv(self.data_path)
             print(f"✅ Loaded {len(self.raw_data)} rows")
             return self.raw_data
         except FileNotFoundError:
@@ -49,17 +85,20 @@ class DataIngestionAgent:
         if self.raw_data is None:
             raise Exception("No data loaded. Call load_data() first.")
         
-        df = self.raw_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
+        # Read-only checks; 'date' is parsed at load time
+        df = self.raw_data
+        total_rows = len(df)
+        start_date, end_date = df['date'].min(), df['date'].max()
+        days_covered = (end_date - start_date).days + 1
 
         report = {
-            'total_rows':len(df),
+            'total_rows':total_rows,
             'date_range': {
-                'start': df['date'].min().strftime('%Y-%m-%d'),
-                'end': df['date'].max().strftime('%Y-%m-%d'),
-                'days_covered': (df['date'].max() - df['date'].min()).days + 1
+                'start': start_date.strftime('%Y-%m-%d'),
+                'end': end_date.strftime('%Y-%m-%d'),
+                'days_covered': days_covered
             },
-            'platforms':df['platform'].unique().tolist(),
+            'platforms':[],
             'missing_values': {},
             'data_completeness': {},
             'outliers': {},
@@ -67,19 +106,23 @@ class DataIngestionAgent:
         }
 
         # Check missing values
-        missing_counts = df.isnull().sum()
+        missing_counts = df.isna().sum()
         report['missing_values'] = {
-            col : int(count) for col, count in missing_counts.items() if count > 0 
+            col : count for col, count in missing_counts.items() if count > 0 
         }
 
-        # Check data completeness (missing days)
-        expected_days = (df['date'].max() - df['date'].min()).days + 1
-        for platform in df['platform'].unique():
-            platform_data = df[df['platform'] == platform]
-            actual_days = platform_data['date'].unique()
-            expected_rows = expected_days * 3
-            actual_rows = len(platform_data)
+        # Per-platform row counts and spend in one grouped pass
+        platform_stats = df.groupby('platform', sort=False, observed=True).agg(
+            rows=('date', 'size'),
+            spend=('spend', 'sum')
+        )
+        # Group keys double as the platform list (first-seen order, like unique())
+        report['platforms'] = platform_stats.index.tolist()
 
+        # Check data completeness (missing days)
+        expected_rows = days_covered * 3
+        for platform, actual_rows in platform_stats['rows'].items():
+            actual_rows = int(actual_rows)
             report['data_completeness'][platform] = {
                 'expected_rows':expected_rows,
                 'actual_rows':actual_rows,
@@ -87,37 +130,41 @@ class DataIngestionAgent:
                 'completeness_percentage':round((actual_rows/expected_rows) * 100)
             }
 
-        # Detect outliers using IQR method
-        for metric in ['impressions', 'clicks', 'spend']:
-            Q1 = df[metric].quantile(0.25)
-            Q3 = df[metric].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5*IQR
-            upper_bound = Q3 + 1.5*IQR
-
-            outliers = df[(df[metric] < lower_bound) | (df[metric] > upper_bound)]
-
-            if len(outliers) > 0:
+        # Detect outliers using IQR method (one quantile pass over all metrics)
+        outlier_metrics = ['impressions', 'clicks', 'spend']
+        values = df[outlier_metrics]
+        quartiles = values.quantile([0.25, 0.75])
+        IQR = quartiles.loc[0.75] - quartiles.loc[0.25]
+        lower_bound = quartiles.loc[0.25] - 1.5*IQR
+        upper_bound = quartiles.loc[0.75] + 1.5*IQR
+
+        outlier_mask = values.lt(lower_bound) | values.gt(upper_bound)
+        outlier_counts = outlier_mask.sum()
+
+        for metric in outlier_metrics:
+            count = int(outlier_counts[metric])
+            if count > 0:
+                is_outlier = outlier_mask[metric]
                 report['outliers'][metric] = {
-                    'count':len(outliers),
-                    'percentage':round((len(outliers)/len(df))*100, 2),
-                    'max_value':float(outliers[metric].max()),
-                    'dates': outliers['date'].dt.strftime('%Y-%m-%d').tolist()[:3]
+                    'count':count,
+                    'percentage':round((count/total_rows)*100, 2),
+                    'max_value':float(values.loc[is_outlier, metric].max()),
+                    'dates': df.loc[is_outlier, 'date'].head(3).dt.strftime('%Y-%m-%d').tolist()
                 }
         
-        # Budget summary
-        total_spend = df['spend'].sum()
+        # Budget summary, reusing the grouped spend instead of rescanning the column
+        platform_spend = platform_stats['spend']
+        total_spend = platform_spend.sum()
         report['budget_summary'] = {
             'total_spend':round(total_spend, 2),
-            'by_platform': {}
-        }
-
-        for platform in df['platform'].unique():
-            platform_spend = df[df['platform']==platform]['spend'].sum()
-            report['budget_summary']['by_platform'][platform] = {
-                'spend':round(platform_spend, 2),
-                'percentage':round((platform_spend/total_spend)*100, 2)
+            'by_platform': {
+                platform: {
+                    'spend':round(spend, 2),
+                    'percentage':round((spend/total_spend)*100, 2)
+                }
+                for platform, spend in platform_spend.items()
             }
+        }
         
         self.data_quality_report = report
         print(f"✅ Data validation complete")
@@ -138,23 +185,24 @@ class DataIngestionAgent:
         if self.raw_data is None:
             raise Exception("No data loaded. Call load_data() first.")
         
-        df = self.raw_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
-
-        # Sort by date
-        df = df.sort_values('date').reset_index(drop=True)
-
-        # Calculate derived features
-        start_date = df['date'].min()
-        df['days_since_start'] = (df['date'] - start_date).dt.days
-        df['week_number'] = (df['days_since_start']//7)+1
-        df['day_of_week'] = df['date'].dt.day_of_week
-        df['day_name'] = df['date'].dt.day_name()
+        # Stable sort by date into a new frame (raw_data is left untouched)
+        df = self.raw_data.sort_values('date', ignore_index=True, kind='mergesort')
+
+        # Calculate derived features from one DatetimeIndex view of the dates.
+        # days_since_start and week_number already use the Performance Analyzer's
+        # dtypes (ANALYSIS_DTYPES), so it has nothing to convert
+        dates = pd.DatetimeIndex(df['date'])
+        start_date = dates.min()
+        days_since_start = (dates - start_date).days
+        df['days_since_start'] = days_since_start.astype('int16')
+        df['week_number'] = pd.Categorical(days_since_start // 7 + 1)
+        df['day_of_week'] = dates.dayofweek.astype('int8')
+        df['day_name'] = pd.Categorical.from_codes(df['day_of_week'], categories=DAY_NAMES)
         df['is_weekend'] = df['day_of_week'] >= 5
 
         # Add Mont and Year
-        df['month'] = df['date'].dt.month
-        df['year'] = df['date'].dt.year
+        df['month'] = dates.month.astype('int8')
+        df['year'] = dates.year.astype('int16')
 
         print(f"✅ Added 7 derived features")
         
@@ -173,26 +221,22 @@ class DataIngestionAgent:
         
         df = self.processed_data.copy()
 
-        # Standarize platform names
-        platform_mapping = {
-            'google_display':'Google Display',
-            'meta':'Meta',
-            'tiktok':'TikTok'
-        }
-        df['platform_display'] = df['platform'].map(platform_mapping)
-
-        # Round metrics to appropiate precision
-        df['cpm'] = df['cpm'].round(2)
-        df['ctr'] = df['ctr'].round(4)
-        df['engagement_rate'] = df['engagement_rate'].round(4)
+        # Standarize platform names; a categorical lets the mapping touch only
+        # the unique labels rather than every row
+        df['platform'] = df['platform'].astype('category')
+        df['creative_id'] = df['creative_id'].astype('category')
+        df['platform_display'] = df['platform'].cat.rename_categories(PLATFORM_DISPLAY_NAMES)
+
+        # Round metrics to appropiate precision; rates are stored as float32.
+        # Spend stays float64 so campaign totals keep cent precision.
+        df['cpm'] = df['cpm'].round(2).astype('float32')
+        df['ctr'] = df['ctr'].round(4).astype('float32')
+        df['engagement_rate'] = df['engagement_rate'].round(4).astype('float32')
         df['spend'] = df['spend'].round(2)
 
-        # Ensure integer types for count metrics
-        df['impressions'] = df['impressions'].astype(int)
-        df['reach'] = df['reach'].astype(int)
-        df['clicks'] = df['clicks'].astype(int)
-        df['engagements'] = df['engagements'].astype(int)
-        df['video_views'] = df['video_views'].astype(int)
+        # Ensure compact integer types for count metrics
+        count_columns = ['impressions', 'reach', 'clicks', 'engagements', 'video_views']
+        df[count_columns] = df[count_columns].astype('int32')
 
         print(f"✅ Platform data normalized")
 
@@ -211,22 +255,29 @@ class DataIngestionAgent:
                 'total_impressions': int(df['impressions'].sum()),
                 'total_clicks': int(df['clicks'].sum()),
                 'total_spend': round(df['spend'].sum(), 2),
-                'avg_cpm': round(df['cpm'].mean(), 2),
-                'avg_ctr': round(df['ctr'].mean(), 4),
+                'avg_cpm': round(float(df['cpm'].mean()), 2),
+                'avg_ctr': round(float(df['ctr'].mean()), 4),
                 'total_engagemnets': int(df['engagements'].sum())
             }, 
             'by_platform':{}
         }
 
-        for platform in df['platform'].unique():
-            platform_data = df[df['platform']==platform]
-            summary['by_platform'][platform] = {
-                'impression': int(platform_data['impressions'].sum()),
-                'clicks': int(platform_data['clicks'].sum()),
-                'spend': round(platform_data['spend'].sum(),2),
-                'avg_cpm': round(platform_data['cpm'].mean(),2),
-                'avg_ctr': round(platform_data['ctr'].mean(), 4),
-                'engagements': int(platform_data['engagements'].sum())
+        platform_stats = df.groupby('platform', sort=False, observed=True).agg(
+            impressions=('impressions', 'sum'),
+            clicks=('clicks', 'sum'),
+            spend=('spend', 'sum'),
+            cpm=('cpm', 'mean'),
+            ctr=('ctr', 'mean'),
+            engagements=('engagements', 'sum')
+        )
+        for row in platform_stats.itertuples():
+            summary['by_platform'][row.Index] = {
+                'impression': int(row.impressions),
+                'clicks': int(row.clicks),
+                'spend': round(row.spend,2),
+                'avg_cpm': round(float(row.cpm),2),
+                'avg_ctr': round(float(row.ctr), 4),
+                'engagements': int(row.engagements)
             }
         return summary
     
@@ -271,16 +322,17 @@ class DataIngestionAgent:
 
         return self.processed_data, full_report
     
-    def save_processed_data(self, output_path: str = 'data/processed/campaign_data_processed.csv'):
-        """Save processed data to CSV."""
+    def save_processed_data(self, output_path: str = 'data/processed/campaign_data_processed.parquet'):
+        """Save processed data to Parquet (keeps dtypes, so readers skip re-parsing)."""
         if self.processed_data is None:
             raise Exception("No processed data to save.")
         
-        self.processed_data.to_csv(output_path, index=False)
+        self.processed_data.to_parquet(output_path, engine='pyarrow', compression='snappy', index=False)
         print(f"\n💾 Processed data saved to: {output_path}")
     
     def save_report(self, report: Dict, output_path: str = 'data/processed/data_quality_report.json'):
         """Save data quality report to JSON."""
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
-        print(f"💾 Quality report saved to: {output_path}")
\ No newline at end of file
+        # orjson serializes the numpy scalars in the report directly
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        print(f"💾 Quality report saved to: {output_path}")
@@ -3,16 +3,47 @@ Agent 3: Insight Generator Agent
 Uses AI to generate actionable business insights from performance data.
 """
 
-import json
-from typing import Dict, List
+import asyncio
+import heapq
+import ijson
+import orjson
+from typing import Dict, List, Optional
 from datetime import datetime
-import os
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
+from src.utils.openai_client import get_async_client, openai_session
 
 # Load environtment variables
 load_dotenv()
 
+# Shared system message; kept constant so every request starts with the same prefix
+SYSTEM_PROMPT = (
+    "You are a marketing analytics expert analyzing a brand awareness campaign. "
+    "You provide clear, actionable insight."
+)
+
+# Sections of Agent 2's analysis that the insight prompts read
+ANALYSIS_SECTIONS = (
+    'overall_kpis',
+    'platform_analysis',
+    'weekly_analysis',
+    'creative_analysis',
+    'day_of_week_analysis'
+)
+
+# Batch API statuses after which a batch will not make further progress
+BATCH_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+# Insight sections returned by the model, in report order
+INSIGHT_CATEGORIES = ('budget_efficiency', 'creative_performance', 'ad_fatigue', 'platform_insights')
+
+# The same reply also ranks the top recommendations across all categories
+RESPONSE_SECTIONS = INSIGHT_CATEGORIES + ('priority_recommendations',)
+
+# Fallback ranking for insights when the model omits the top-5 section
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+PRIORITY_URGENCY = {'high': 'immediate', 'medium': 'this_week', 'low': 'next_week'}
+
 class InsightGeneratorAgent:
     """
     Agent that uses GPT-4 to generate business insights from campaign performance data.
@@ -27,7 +58,6 @@ class InsightGeneratorAgent:
             performance_analysis: Complete analysis from Agent 2
         """
         self.analysis = performance_analysis
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
         self.insights = {
             'budget_efficiency':[],
             'creative_performance':[],
@@ -35,15 +65,43 @@ class InsightGeneratorAgent:
             'platform_insights':[],
             'priority_recommendations':[]
         }
+        self._context_cache: Optional[str] = None
     
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Connection-pooled OpenAI client of the running event loop (see src.utils.openai_client)."""
+        return get_async_client()
+
     def _create_analysis_context(self) -> str:
+        """Return the analysis context, building it on first use."""
+        if self._context_cache is None:
+            self._context_cache = self._build_context()
+        return self._context_cache
+
+    def _prompt_prefix(self) -> str:
+        """
+        Build the CONTEXT block that opens every insight prompt.
+        It only depends on the analysis, so it is byte-identical across calls
+        and OpenAI's automatic prompt caching can reuse it.
+        """
+        day_patterns = orjson.dumps(
+            self.analysis['day_of_week_analysis'],
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+        return (
+            f"CONTEXT:\n{self._create_analysis_context()}\n\n"
+            f"DAY-OF-WEEK PATTERNS:\n{day_patterns}\n\n"
+            "---\nTASK:\n"
+        )
+
+    def _build_context(self) -> str:
         """Create a comprehensive context summary for GPT-4."""
         overall = self.analysis['overall_kpis']
         platforms = self.analysis['platform_analysis']
         weekly = self.analysis['weekly_analysis']
         creatives = self.analysis['creative_analysis']
 
-        context = f"""
+        parts = [f"""
             CAMPAIGN PERFORMANCE SUMMARY:
 
             OVERALL METRICS:
@@ -55,10 +113,10 @@ class InsightGeneratorAgent:
             - Campaign Duration: {overall['campaign_days']} days
 
             PLATFORM PERFORMANCE:
-        """
+        """]
 
         for platform, metrics in platforms.items():
-            context += f"""
+            parts.append(f"""
             {platform.upper()}:
             - Impressions: {metrics['impressions']:,}
             - CTR: {metrics['avg_ctr']:.2%}
@@ -66,324 +124,202 @@ class InsightGeneratorAgent:
             - Cost Per Click: ${metrics['cost_per_click']}
             - Spend: ${metrics['spend']:,} ({metrics['spend_percentage']}% of budget)
             - Engagement Rate: {metrics['avg_engagement_rate']:.2%}
-            """
+            """)
         
-        context += "\nWEEKLY TRENDS:\n"
-        for week_key in sorted(weekly.keys()):
-            week = weekly[week_key]
+        parts.append("\nWEEKLY TRENDS:\n")
+        # Agent 2 emits weeks in order; sorting the 'week_N' keys would put week_10 before week_2
+        for week in weekly.values():
             change = ""
             if 'ctr_change_pct' in week:
-                change = f" (Change: {week['ctr_change_pct']:+1f}%)"
-            context += f"Week {week['week_number']} : CTR {week['avg_ctr']:.2%}, CPM ${week['avg_cpm']}{change}\n"
+                change = f" (Change: {week['ctr_change_pct']:+.1f}%)"
+            parts.append(f"Week {week['week_number']} : CTR {week['avg_ctr']:.2%}, CPM ${week['avg_cpm']}{change}\n")
         
-        context += "\nCREATIVE PERFORMANCE (Top & Bottom):\n"
-        sortted_creatives = sorted(
-            creatives.items(),
-            key=lambda x: x[1]['avg_ctr'],
-            reverse=True
-        )
+        parts.append("\nCREATIVE PERFORMANCE (Top & Bottom):\n")
+        # Only the extremes are reported, so select them without a full sort
+        creative_ctr = lambda item: item[1]['avg_ctr']
 
         # Top 3
-        context += "Top Performers:\n"
-        for creative_id, metrics in sortted_creatives[:3]:
-            context += f"- {creative_id}: CTR {metrics['avg_ctr']:.2%}, Spend ${metrics['spend']:,}\n"
-
-        # Bottom 3
-        context += "Bottom Performers:\n"
-        for creative_id, metrics in sortted_creatives[-3:]:
-            context += f"- {creative_id}: CTR {metrics['avg_ctr']:.2%}, Spend ${metrics['spend']:,}\n"
+        parts.append("Top Performers:\n")
+        for creative_id, metrics in heapq.nlargest(3, creatives.items(), key=creative_ctr):
+            parts.append(f"- {creative_id}: CTR {metrics['avg_ctr']:.2%}, Spend ${metrics['spend']:,}\n")
+
+        # Bottom 3, listed from highest to lowest CTR like the top performers
+        parts.append("Bottom Performers:\n")
+        for creative_id, metrics in reversed(heapq.nsmallest(3, creatives.items(), key=creative_ctr)):
+            parts.append(f"- {creative_id}: CTR {metrics['avg_ctr']:.2%}, Spend ${metrics['spend']:,}\n")
         
-        return context
+        return "".join(parts)
     
-    def generate_budget_efficiency_insight(self) -> List[Dict]:
-        """Generate insights about budget allocation and cost efficiency."""
-        print("\n💰 Generating budget efficiency insights...")
-
-        context = self._create_analysis_context()
-        platforms = self.analysis['platform_analysis']
-
-        prompt = f"""You are a marketing analystics expert analyzing a brand awareness campaign.
-        {context}
-
-        Task: Generate 2-3 actionable insight about BUDGET EFFICIENCY and COST EFFECTIVENESS.
-        
-        Focus on:
-        1. Which platform delivers the best value (lowest CPM, lowest CPC)?
-        2. Are there budget reallocation opportunities?
-        3. Where might we br wasting money?
+    def _insights_request(self) -> Dict:
+        """Chat completion payload for the combined insights call."""
+        # Static prefix first, task last, so repeated prompts share a cacheable prefix
+        task = """Task: Generate 2-3 actionable insights for EACH of the four sections below,
+        then rank the most important recommendations across all of them.
+
+        1. budget_efficiency - BUDGET EFFICIENCY and COST EFFECTIVENESS
+           - Which platform delivers the best value (lowest CPM, lowest CPC)?
+           - Are there budget reallocation opportunities?
+           - Where might we be wasting money?
+           - Include specific recommendations with dollar amounts if possible
+
+        2. creative_performance - CREATIVE PERFORMANCE
+           - Which creatives are top performers vs underperformers?
+           - What's the performance gap between best and worst?
+           - Which creatives should be scaled, paused, or replaced?
+           - Be specific about which creative IDs and include performance percentages
+
+        3. ad_fatigue - AD FATIGUE and CREATIVE REFRESH TIMING
+           - Is there evidence of ad fatigue (declining performance over time)?
+           - When did performance start declining?
+           - When should creatives be refreshed?
+           - Pay special attention to week-over-week CTR changes
+
+        4. platform_insights - PLATFORM-SPECIFIC PERFORMANCE
+           - Platform comparison with specific metrics
+           - Strategic implication
+           - Platform-specific recommendation
+           - Include cross-platform comparisons and timing recommendations
+
+        5. priority_recommendations - TOP 5 MOST IMPORTANT recommendations from sections 1-4, ranked by:
+           - Potential business impact (revenue, cost savings)
+           - Urgency (how quickly action is needed)
+           - Ease of implementation
 
         For each insight, provide:
         - Clear observation with specific numbers
         - Business impact
-        - Specifi recommendation with dollar amounts if possible
-
-        Format as JSON array:
-        [
-            {{
-                "insight": "Clear statement of what you found",
-                "impact": "Why this matters to busniness outcomes",
-                "recommendation": "Specific action to take",
-                "priority": "high/medium/low"
-            }}
-        ] 
+        - Specific recommendation
+
+        Return a JSON object with exactly these five keys, each holding an array:
+        {
+            "budget_efficiency": [
+                {
+                    "insight": "Clear statement of what you found",
+                    "impact": "Why this matters to business outcomes",
+                    "recommendation": "Specific action to take",
+                    "priority": "high/medium/low"
+                }
+            ],
+            "creative_performance": [...],
+            "ad_fatigue": [...],
+            "platform_insights": [...],
+            "priority_recommendations": [
+                {
+                    "rank": 1,
+                    "insight": "...",
+                    "recommendation": "...",
+                    "estimated_impact": "Specific outcome (e.g., 'Could save $X' or 'Increase CTR by Y%')",
+                    "urgency": "immediate/this_week/next_week"
+                }
+            ]
+        }
 
         Be specific with numbers and percentages. Focus on actionable recommendations."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model= "gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a marketing analytics expert who provides clear, actionable insight."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-
-            insights_text = response.choices[0].message.content
-            # Extract JSON from response (handle markdowb code blocks)
-            if "```json" in insights_text:
-                insights_text = insights_text.split("```json")[1].split('```')[0].strip()
-            elif "```" in insights_text:
-                insights_text = insights_text.split("```")[1].split("```")[0].strip()
-            
-            insights = json.loads(insights_text)
-
-            print(f"✅ Generated {len(insights)} budget efficiency insights")
-            return insights
-        
-        except Exception as e:
-            print(f"⚠️  Error generating budget insights: {str(e)}")
-            return []
-    
-    def generate_creative_performance_insights(self) -> List[Dict]:
-        """Generate insights about creative performance."""
-        print("\n🎨 Generating creative performance insights...")
-
-        context = self._create_analysis_context()
-
-        prompt = f"""You are a marketing analystics expert analyzing a brand awarness campaign.
-        {context}
-
-        Task: Generate 2-3 actionable insight about CREATIVE PERFORMANCE.
-
-        Focus on:
-        1. Which creatives are top performers vs underperformers?
-        2. What's the performance gap between best and worst?
-        3. Which creatives should be scaled, paused, or replaced?
-
-        For each insight, provide:
-        - Clear observation with specific performance metrics
-        - Business impact (wasted spend, opportunity cost)
-        - Specific recommendation (pause, scale, test new variants)
+        return dict(
+            model= "gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": self._prompt_prefix() + task}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.7,
+            max_tokens=4000
+        )
 
-        Format as JSON array with same structure as before
+    @staticmethod
+    def _parse_insights(content: str) -> Dict[str, List[Dict]]:
+        """Split a combined insights reply into its categories and top recommendations."""
+        # JSON mode returns a bare object, so no markdown fences to strip
+        result = orjson.loads(content)
+        return {section: result.get(section, []) for section in RESPONSE_SECTIONS}
 
-        Be specific about which creative IDs and include performance percentages."""
+    async def generate_all_insights(self) -> Dict[str, List[Dict]]:
+        """
+        Generate all four insight categories and the top-5 ranking in a single API call.
+        The analysis context is sent once and the model returns one JSON object
+        keyed by section. The reply is streamed and parsed as it arrives, so each
+        category is ready as soon as its array closes.
+        """
+        print("\n💡 Generating budget, creative, ad fatigue and platform insights...")
+
+        insights = {section: [] for section in RESPONSE_SECTIONS}
+        # Push parser: completed (category, insights) pairs land in `sections`
+        sections = ijson.sendable_list()
+
+        def collect_sections():
+            """Move the sections parsed so far into insights."""
+            for section, section_items in sections:
+                if section in insights:
+                    insights[section] = section_items
+                    if section == 'priority_recommendations':
+                        print(f"✅ Prioritized top {len(section_items)} recommendations")
+                    else:
+                        print(f"✅ Generated {len(section_items)} {section.replace('_', ' ')} insights")
+            del sections[:]
 
         try:
-            response = self.client.chat.completions.create(
-                model= "gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a marketing analytics expert who provides clear, actionable insight."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-
-            insights_text = response.choices[0].message.content
-            # Extract JSON from response (handle markdowb code blocks)
-            if "```json" in insights_text:
-                insights_text = insights_text.split("```json")[1].split('```')[0].strip()
-            elif "```" in insights_text:
-                insights_text = insights_text.split("```")[1].split("```")[0].strip()
-            
-            insights = json.loads(insights_text)
-
-            print(f"✅ Generated {len(insights)} creative performance insights")
+            stream = await self.client.chat.completions.create(**self._insights_request(), stream=True)
+
+            parser = ijson.kvitems_coro(sections, '', use_float=True)
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                parser.send(chunk.choices[0].delta.content.encode())
+                collect_sections()
+            parser.close()
+            collect_sections()
             return insights
         
         except Exception as e:
-            print(f"⚠️  Error generating creative insights: {str(e)}")
-            return []
-    
-    def generate_ad_fatigue_insights(self) -> List[Dict]:
-        """Generate insights about ad fatigue and creative refresh timing."""
-
-        context = self._create_analysis_context()
-
-        prompt = f"""You are a marketing analytics expert analyzing a brand awareness campaign.
-        {context}
-
-        Task: Generate 2-3 actionable insights about AD FATIGUE and CREATIVE REFRESH TIMING.
-
-        Focus on:
-        1. Is there evidence of ad fatigue (declining performance over time)?
-        2. When did perfromance start declining?
-        3. When should creatives be refreshed?
-
-        For each insight, provide:
-        - Clear observation about performance trends
-        - Impact on campaign effectiveness
-        - Specific timing recommendation for refresh
-
-        Format as JSON array same structure as before.
-
-        Pay special attention to week-over-week CTR changes."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model= "gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a marketing analytics expert who provides clear, actionable insight."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-
-            insights_text = response.choices[0].message.content
-            # Extract JSON from response (handle markdowb code blocks)
-            if "```json" in insights_text:
-                insights_text = insights_text.split("```json")[1].split('```')[0].strip()
-            elif "```" in insights_text:
-                insights_text = insights_text.split("```")[1].split("```")[0].strip()
-            
-            insights = json.loads(insights_text)
-
-            print(f"✅ Generated {len(insights)} ad fatigue insights")
+            # A cut-off or malformed reply still keeps every section that closed before it
+            collect_sections()
+            print(f"⚠️  Error generating insights: {str(e)}")
             return insights
-        
-        except Exception as e:
-            print(f"⚠️  Error generating ad fatigue insights: {str(e)}")
-            return []
-    
-    def generate_platform_insights(self) -> List[Dict]:
-        """Generate platform-specific insights and comparisons."""
-        print("\n📱 Generating platform-specific insights...")
-
-        context = self._create_analysis_context()
-        day_patterns = self.analysis['day_of_week_analysis']
-
-        prompt = f"""You are a marketing analytics expert analyzing a brand awareness campaign.
-        {context}
-
-        DAY-OF-WEEK PATTERNS:
-        {json.dumps(day_patterns, indent=2)}
-
-        Task: Generate 2-3 actionable insigts about PLATFROM-SPECIFIC PERFORMANCE.
-
-        Focus on:
-        - Platform comparison with specific metrics
-        - Strategic implication
-        - Platform-specific recommendation
 
-        Format as JSON array with same structure as before
-
-
-        Include cross-platform comparisons and timing recommendations."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model= "gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a marketing analytics expert who provides clear, actionable insight."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-
-            insights_text = response.choices[0].message.content
-            # Extract JSON from response (handle markdowb code blocks)
-            if "```json" in insights_text:
-                insights_text = insights_text.split("```json")[1].split('```')[0].strip()
-            elif "```" in insights_text:
-                insights_text = insights_text.split("```")[1].split("```")[0].strip()
-            
-            insights = json.loads(insights_text)
-
-            print(f"✅ Generated {len(insights)} platform insights")
-            return insights
-        
-        except Exception as e:
-            print(f"⚠️  Error generating platform insights: {str(e)}")
-            return []
-    
     def prioritize_recommendations(self) -> List[Dict]:
-        """Use AI to prioritize all insights by business impact."""
-        print("\n🎯 Prioritizing recommendations...")
-
+        """
+        Rank generated insights locally by their priority field.
+        Used when the model reply has no priority_recommendations section,
+        so no extra API call is spent on ranking.
+        """
         all_insights = (
             self.insights['budget_efficiency'] + 
             self.insights['creative_performance'] +
             self.insights['ad_fatigue'] +
             self.insights['platform_insights']
         )
-
-        prompt = f"""You are a marketing director reviewing these insights from your campaign analysis:
-        {json.dumps(all_insights, indent=2)}
-
-        Task: Select the TOP 5 MOST IMPORTANT  recommendations and rank them by:
-        1. Potential business impact (revenue, cost savings)
-        2. Urgency (how quickly action is needed)
-        3.  Ease of implementation
-
-        Return ONLY the top 5 as a JSON array, adding an 'estimated_impact' field describing potential outcomes.
-
-        Format:
-        [
-        {{
-            "rank": 1,
-            "insight": "...",
-            "recommendation": "...",
-            "estimated_impact": "Specific outcome (e.g., 'Could save $X' or 'Increase CTR by Y%')",
-            "urgency": "immediate/this_week/next_week"
-        }}]
-        """
-        try:
-            response = self.client.chat.completions.create(
-                model= "gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a strategic marketing director."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-
-            insights_text = response.choices[0].message.content
-            # Extract JSON from response (handle markdowb code blocks)
-            if "```json" in insights_text:
-                insights_text = insights_text.split("```json")[1].split('```')[0].strip()
-            elif "```" in insights_text:
-                insights_text = insights_text.split("```")[1].split("```")[0].strip()
-            
-            insights = json.loads(insights_text)
-
-            print(f"✅ Prioritized top {len(insights)} recommendations")
-            return insights
-        
-        except Exception as e:
-            print(f"⚠️  Error prioritizing recommendations: {str(e)}")
-            return []
+        # sorted() is stable, so ties keep the category order
+        ranked = sorted(
+            all_insights,
+            key=lambda insight: PRIORITY_ORDER.get(str(insight.get('priority', '')).lower(), len(PRIORITY_ORDER))
+        )[:5]
+
+        return [
+            {
+                'rank': rank,
+                'insight': insight.get('insight', ''),
+                'recommendation': insight.get('recommendation', ''),
+                'estimated_impact': insight.get('impact', ''),
+                'urgency': PRIORITY_URGENCY.get(str(insight.get('priority', '')).lower(), 'next_week')
+            }
+            for rank, insight in enumerate(ranked, 1)
+        ]
+
+    def _ensure_priorities(self):
+        """Fill in a local top-5 ranking if the model did not return one."""
+        if not self.insights['priority_recommendations']:
+            self.insights['priority_recommendations'] = self.prioritize_recommendations()
+            print(f"🎯 Ranked top {len(self.insights['priority_recommendations'])} recommendations locally")
     
-    def run(self) -> Dict:
-        """Execute complete insight generation pipeline."""
-        print("🚀 Starting Insight Generator Agent...")
-        print("=" * 60)
-
-        # Generate insights for each category
-        self.insights['budget_efficiency'] = self.generate_budget_efficiency_insight()
-        self.insights['creative_performance'] = self.generate_creative_performance_insights()
-        self.insights['ad_fatigue'] = self.generate_ad_fatigue_insights()
-        self.insights['platform_insights'] = self.generate_platform_insights()
-
-        # Prioritize all recommendations
-        self.insights['priority_recommendations'] = self.prioritize_recommendations()
-
-        # Add metadata
+    async def _generate_all(self):
+        """Generate all category insights and their ranking in one call."""
+        async with openai_session():
+            self.insights.update(await self.generate_all_insights())
+        self._ensure_priorities()
+
+    def _add_metadata(self):
+        """Attach generation metadata to the insights."""
         self.insights['metadata'] = {
             'generated_at':datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'total_insights': sum([
@@ -394,6 +330,14 @@ class InsightGeneratorAgent:
             ])
         }
 
+    def run(self) -> Dict:
+        """Execute complete insight generation pipeline."""
+        print("🚀 Starting Insight Generator Agent...")
+        print("=" * 60)
+
+        asyncio.run(self._generate_all())
+        self._add_metadata()
+
         print("\n"+"="*60)
         print("✅ INSIGHT GENERATION COMPLETE")
         print("="*60)
@@ -402,13 +346,112 @@ class InsightGeneratorAgent:
 
         return self.insights
 
+    @staticmethod
+    async def _run_batch_stage(client: AsyncOpenAI, requests: Dict[str, Dict], poll_interval: float) -> Dict[str, str]:
+        """
+        Submit chat completion payloads as one OpenAI batch and wait for it.
+        Returns the reply content for each custom_id that completed successfully.
+        """
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            })
+            for custom_id, body in requests.items()
+        ]
+        batch_file = await client.files.create(
+            file=("insights_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📤 Submitted batch {batch.id} ({len(lines)} requests)")
+
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != 'completed':
+            raise Exception(f"❌ Batch {batch.id} ended with status: {batch.status}")
+
+        # Successful requests land in the output file and failed ones in the error
+        # file; either is None when the batch produced no such records
+        records = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                result_file = await client.files.content(file_id)
+                records.extend(orjson.loads(line) for line in result_file.content.splitlines())
+
+        contents = {}
+        for record in records:
+            response = record.get('response') or {}
+            if response.get('status_code') == 200:
+                contents[record['custom_id']] = response['body']['choices'][0]['message']['content']
+            else:
+                error = record.get('error') or (response.get('body') or {}).get('error')
+                print(f"⚠️  Batch request {record['custom_id']} failed: {error}")
+        return contents
+
+    @classmethod
+    def run_batch(cls, campaigns: Dict[str, Dict], poll_interval: float = 30) -> Dict[str, Dict]:
+        """
+        Generate insights for many campaigns through the OpenAI Batch API.
+        Meant for scheduled, non-interactive runs: batches are billed at a lower
+        rate but can take up to 24h. Each campaign is one request, since the
+        combined reply already carries the top-5 ranking.
+
+        Args:
+            campaigns: Performance analysis from Agent 2, keyed by campaign id
+            poll_interval: Seconds between batch status checks
+
+        Returns: insights dict (same shape as run()) keyed by campaign id.
+            Campaigns whose request failed are reported and left out.
+        """
+        print(f"🚀 Starting batch insight generation for {len(campaigns)} campaigns...")
+        agents = {campaign_id: cls(analysis) for campaign_id, analysis in campaigns.items()}
+
+        async def _run():
+            async with openai_session() as client:
+                return await cls._run_batch_stage(
+                    client,
+                    {campaign_id: agent._insights_request() for campaign_id, agent in agents.items()},
+                    poll_interval
+                )
+
+        contents = asyncio.run(_run())
+
+        completed = {}
+        for campaign_id, agent in agents.items():
+            if campaign_id not in contents:
+                print(f"⚠️  No insights returned for campaign {campaign_id}; skipping it")
+                continue
+            agent.insights.update(agent._parse_insights(contents[campaign_id]))
+            agent._ensure_priorities()
+            agent._add_metadata()
+            completed[campaign_id] = agent.insights
+
+        print(f"✅ Batch insight generation complete for {len(completed)}/{len(agents)} campaigns")
+        return completed
+
     def save_insights(self, output_path: str = 'data/processed/insights.json'):
         """Save insights to JSON file."""
         if not self.insights:
             raise Exception("No insights to save. Run analysis first.")
         
-        with open(output_path, 'w') as f:
-            json.dump(self.insights, f, indent=2)
+        # Write one top-level section at a time so the whole document is never buffered
+        with open(output_path, 'wb') as f:
+            f.write(b'{\n')
+            for i, (key, value) in enumerate(self.insights.items()):
+                if i:
+                    f.write(b',\n')
+                f.write(orjson.dumps(key) + b': ')
+                f.write(orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            f.write(b'\n}')
         
         print(f"\n💾 Insights saved to: {output_path}")
     
@@ -7,7 +7,33 @@ import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple
 from datetime import datetime
-import json
+import orjson
+import os
+
+# Keyed analysis sections that are also exported as Parquet tables
+ANALYSIS_TABLES = ('weekly_analysis', 'platform_analysis', 'creative_analysis')
+
+# Dtypes the analysis relies on; group keys as categories, narrow numeric
+# columns for counts and daily rates (spend stays float64 so totals add up to the cent)
+ANALYSIS_DTYPES = {
+    'platform': 'category',
+    'creative_id': 'category',
+    'week_number': 'category',
+    'date': 'datetime64[ns]',
+    'is_weekend': 'bool',
+    'days_since_start': 'int16',
+    'impressions': 'int32',
+    'reach': 'int32',
+    'clicks': 'int32',
+    'engagements': 'int32',
+    'video_views': 'int32',
+    'cpm': 'float32',
+    'ctr': 'float32',
+    'engagement_rate': 'float32'
+}
+
+# Columns of Agent 1's processed data that the analysis actually reads
+ANALYSIS_COLUMNS = (*ANALYSIS_DTYPES, 'spend')
 
 class PerformanceAnalyzerAgent:
     """
@@ -20,29 +46,63 @@ class PerformanceAnalyzerAgent:
         Initialize Performance Analyzer Agent.
         
         Args:
-            processed_data: Cleaned and processed campaign data from Agent 1
+            processed_data: Cleaned and processed campaign data from Agent 1.
+                Agent 1 emits ANALYSIS_DTYPES, so its frame is used as is; any other
+                input costs one copy with the mismatched columns converted.
         """
-        self.data = processed_data
+        # Categorical group keys take pandas' fast groupby path. astype copies the
+        # whole frame even when no dtype changes, so only call it when one does
+        mismatched = {
+            column: dtype for column, dtype in ANALYSIS_DTYPES.items()
+            if processed_data[column].dtype != dtype
+        }
+        self.data = processed_data.astype(mismatched) if mismatched else processed_data
         self.analysis_result = {}
 
+    @classmethod
+    def from_path(cls, parquet_path: str) -> 'PerformanceAnalyzerAgent':
+        """
+        Build the agent straight from Agent 1's processed Parquet file.
+        
+        Only ANALYSIS_COLUMNS are read, and the loaded frame is owned by the agent,
+        so the caller never holds a second copy of the data.
+        
+        Args:
+            parquet_path: Path to campaign_data_processed.parquet
+        """
+        return cls(pd.read_parquet(parquet_path, engine='pyarrow', columns=list(ANALYSIS_COLUMNS)))
+
+    @staticmethod
+    def _add_weighted_rates(stats: pd.DataFrame) -> pd.DataFrame:
+        """Derive avg CPM/CTR/engagement rate from grouped sums (impression-weighted)."""
+        stats['avg_cpm'] = stats['spend'] * 1000 / stats['impressions']
+        stats['avg_ctr'] = stats['clicks'] / stats['impressions']
+        stats['avg_engagement_rate'] = stats['engagements'] / stats['impressions']
+        return stats
+
     def calculate_overall_kpis(self) -> Dict:
         """Calculate campaign-level KPIs."""
         print("\n📊 Calculating overall KPIs...")
 
         df = self.data
 
+        # Column totals in one reduction; rates are derived from them so they
+        # are impression-weighted rather than unweighted means of daily ratios
+        totals = df[['impressions', 'reach', 'clicks', 'spend', 'engagements', 'video_views']].sum()
+        impressions = totals['impressions']
+
         kpis = {
-            'total_impressions': int(df['impressions'].sum()),
-            'total_reach': int(df['reach'].sum()),
-            'total_clicks': int(df['clicks'].sum()),
-            'total_spend': round(df['spend'].sum(), 2),
-            'total_engagements': int(df['engagements'].sum()),
-            'total_video_views': int(df['video_views'].sum()),
-            'average_cpm': round(df['cpm'].mean(), 2),
-            'average_ctr': round(df['ctr'].mean(), 4),
-            'average_engagement_rate': round(df['engagement_rate'].mean(), 4),
-            'frequency': round(df['impressions'].sum() / df['reach'].sum(), 2),
-            'cost_per_click': round(df['spend'].sum() / df['clicks'].sum(), 2),
+            'total_impressions': int(impressions),
+            'total_reach': int(totals['reach']),
+            'total_clicks': int(totals['clicks']),
+            'total_spend': round(float(totals['spend']), 2),
+            'total_engagements': int(totals['engagements']),
+            'total_video_views': int(totals['video_views']),
+            'average_cpm': round(float(totals['spend'] * 1000 / impressions), 2),
+            'average_ctr': round(float(totals['clicks'] / impressions), 4),
+            'average_engagement_rate': round(float(totals['engagements'] / impressions), 4),
+            'frequency': round(float(impressions / totals['reach']), 2),
+            'cost_per_click': round(float(totals['spend'] / totals['clicks']), 2),
             'campaign_days': int(df['days_since_start'].max()+1),
             'platforms_count': int(df['platform'].nunique()),
             'creative_count': int(df['creative_id'].nunique())
@@ -62,26 +122,39 @@ class PerformanceAnalyzerAgent:
 
 
         df = self.data
-        platform_analysis = {}
 
-        for platform in df['platform'].unique():
-            platform_data = df[df['platform']==platform]
-
-            platform_analysis[platform] = {
-                'impressions': int(platform_data['impressions'].sum()),
-                'reach': int(platform_data['reach'].sum()),
-                'clicks': int(platform_data['clicks'].sum()),
-                'spend': round(platform_data['spend'].sum(), 2),
-                'engagements': int(platform_data['engagements'].sum()),
-                'video_views': int(platform_data['video_views'].sum()),
-                'avg_cpm': round(platform_data['cpm'].mean(), 2),
-                'avg_ctr': round(platform_data['ctr'].mean(), 4),
-                'avg_engagement_rate': round(platform_data['engagement_rate'].mean(), 4),
-                'frequency': round(platform_data['impressions'].sum() / platform_data['reach'].sum(), 2),
-                'cost_per_click': round(platform_data['spend'].sum() / platform_data['clicks'].sum(), 2) if platform_data['clicks'].sum() > 0 else 0,
-                'spend_percentage': round((platform_data['spend'].sum()/df['spend'].sum())* 100, 2),
-                'impression_share': round((platform_data['impressions'].sum()/df['impressions'].sum())*100, 2)
-            }
+        # One grouped pass for every per-platform sum and mean
+        stats = df.groupby('platform', sort=False, observed=True).agg(
+            impressions=('impressions', 'sum'),
+            reach=('reach', 'sum'),
+            clicks=('clicks', 'sum'),
+            spend=('spend', 'sum'),
+            engagements=('engagements', 'sum'),
+            video_views=('video_views', 'sum')
+        )
+        stats = self._add_weighted_rates(stats)
+        stats['frequency'] = stats['impressions'] / stats['reach']
+        stats['cost_per_click'] = (stats['spend'] / stats['clicks']).where(stats['clicks'] > 0, 0)
+        stats['spend_percentage'] = stats['spend'] / stats['spend'].sum() * 100
+        stats['impression_share'] = stats['impressions'] / stats['impressions'].sum() * 100
+
+        # Round and cast once per column, then emit native Python values per platform
+        platform_analysis = stats.round({
+            'spend': 2,
+            'avg_cpm': 2,
+            'avg_ctr': 4,
+            'avg_engagement_rate': 4,
+            'frequency': 2,
+            'cost_per_click': 2,
+            'spend_percentage': 2,
+            'impression_share': 2
+        }).astype({
+            'impressions': 'int64',
+            'reach': 'int64',
+            'clicks': 'int64',
+            'engagements': 'int64',
+            'video_views': 'int64'
+        }).to_dict('index')
         print(f"✅ Platform analysis complete for {len(platform_analysis)} platforms")
 
         return platform_analysis
@@ -91,38 +164,40 @@ class PerformanceAnalyzerAgent:
         print("\n📊 Analyzing week-over-week trends...")
 
         df = self.data
-        weekly_analysis = {}
-
-        for week in sorted(df['week_number'].unique()):
-            week_data = df[df['week_number']==week]
-
-            weekly_analysis[f'week_{week}'] = {
-                'week_number': int(week),
-                'impressions': int(week_data['impressions'].sum()),
-                'clicks': int(week_data['clicks'].sum()),
-                'spend': round(week_data['spend'].sum(), 2),
-                'avg_cpm': round(week_data['cpm'].mean(), 2),
-                'avg_ctr': round(week_data['ctr'].mean(), 3),
-                'avg_engagement_rate': round(week_data['engagement_rate'].mean(), 4),
-                'days_with_data': int(week_data['date'].nunique())
-            }
-        
-        weeks = sorted([int(k.split('_')[1]) for k in weekly_analysis.keys()])
-        for i in range(1, len(weeks)):
-            current_week = f'week_{weeks[i]}'
-            previous_week = f'week_{weeks[i-1]}'
-
-            weekly_analysis[current_week]['ctr_change_pct'] = round(
-                ((weekly_analysis[current_week]['avg_ctr'] - 
-                    weekly_analysis[previous_week]['avg_ctr']) / 
-                    weekly_analysis[previous_week]['avg_ctr']) * 100 , 2
-            ) if weekly_analysis[previous_week]['avg_ctr'] > 0 else 0
-
-            weekly_analysis[current_week]['cpm_change_pct'] = round(
-                ((weekly_analysis[current_week]['avg_cpm'] - 
-                    weekly_analysis[previous_week]['avg_cpm']) / 
-                    weekly_analysis[previous_week]['avg_cpm']) * 100 , 2
-            ) if weekly_analysis[previous_week]['avg_cpm'] > 0 else 0
+
+        stats = df.groupby('week_number', sort=True, observed=True).agg(
+            impressions=('impressions', 'sum'),
+            clicks=('clicks', 'sum'),
+            spend=('spend', 'sum'),
+            engagements=('engagements', 'sum'),
+            days_with_data=('date', 'nunique')
+        )
+        stats = self._add_weighted_rates(stats)
+
+        # Week-over-week changes on the rounded weekly averages, as reported
+        for metric, decimals in (('ctr', 3), ('cpm', 2)):
+            current = stats[f'avg_{metric}'].astype('float64').round(decimals)
+            previous = current.shift()
+            stats[f'{metric}_change_pct'] = (
+                ((current - previous) / previous * 100).round(2).where(previous > 0, 0)
+            )
+
+        stats = stats.round({
+            'spend': 2,
+            'avg_cpm': 2,
+            'avg_ctr': 3,
+            'avg_engagement_rate': 4
+        })
+        stats.index = stats.index.astype('int64')
+        weeks = stats.reset_index()[[
+            'week_number', 'impressions', 'clicks', 'spend', 'avg_cpm', 'avg_ctr',
+            'avg_engagement_rate', 'days_with_data', 'ctr_change_pct', 'cpm_change_pct'
+        ]].astype({'impressions': 'int64', 'clicks': 'int64', 'days_with_data': 'int64'}).to_dict('records')
+
+        # The first week has no previous week to compare against
+        if weeks:
+            del weeks[0]['ctr_change_pct'], weeks[0]['cpm_change_pct']
+        weekly_analysis = {f"week_{week['week_number']}": week for week in weeks}
 
         print(f"✅ Weekly analysis complete for {len(weekly_analysis)} weeks")
 
@@ -133,22 +208,26 @@ class PerformanceAnalyzerAgent:
         print("\n📊 Analyzing creative performance...")
 
         df = self.data
-        creative_analysis = {}
-
-        for creative in df['creative_id'].unique():
-            creative_data = df[df['creative_id'] == creative]
-            platform = creative_data['platform'].iloc[0]
-
-            creative_analysis[creative] = {
-                'platform': platform,
-                'impressions': int(creative_data['impressions'].sum()),
-                'clicks': int(creative_data['clicks'].sum()),
-                'spend': round(creative_data['spend'].sum(), 2),
-                'avg_ctr': round(creative_data['ctr'].mean(), 4),
-                'avg_cpm': round(creative_data['cpm'].mean(), 2),
-                'avg_engagement_rate': round(creative_data['engagement_rate'].mean(), 4),
-                'days_active': int(creative_data['date'].nunique())
-            }
+
+        stats = df.groupby('creative_id', sort=False, observed=True).agg(
+            platform=('platform', 'first'),
+            impressions=('impressions', 'sum'),
+            clicks=('clicks', 'sum'),
+            spend=('spend', 'sum'),
+            engagements=('engagements', 'sum'),
+            days_active=('date', 'nunique')
+        )
+        stats = self._add_weighted_rates(stats)
+
+        creative_analysis = stats.round({
+            'spend': 2,
+            'avg_ctr': 4,
+            'avg_cpm': 2,
+            'avg_engagement_rate': 4
+        })[[
+            'platform', 'impressions', 'clicks', 'spend', 'avg_ctr', 'avg_cpm',
+            'avg_engagement_rate', 'days_active'
+        ]].astype({'impressions': 'int64', 'clicks': 'int64', 'days_active': 'int64'}).to_dict('index')
         
         for platform in df['platform'].unique():
             platform_creatives = {
@@ -176,22 +255,17 @@ class PerformanceAnalyzerAgent:
 
         df = self.data
 
-        # Overall weekdays vs weekend
+        # Overall weekdays vs weekend, both periods from one grouped pass
+        period_stats = df.groupby('is_weekend').agg({
+            'ctr':'mean',
+            'cpm':'mean',
+            'engagement_rate':'mean',
+            'impressions':'sum',
+            'clicks':'sum'
+        }).reindex([False, True])
         weekday_weekend = {
-            'weekday': df[~df['is_weekend']].agg({
-                'ctr':'mean',
-                'cpm':'mean',
-                'engagement_rate':'mean',
-                'impressions':'sum',
-                'clicks':'sum'
-            }).to_dict(),
-            'weekend': df[df['is_weekend']].agg({
-                'ctr':'mean',
-                'cpm':'mean',
-                'engagement_rate':'mean',
-                'impressions':'sum',
-                'clicks':'sum'
-            }).to_dict()
+            'weekday': period_stats.loc[False].to_dict(),
+            'weekend': period_stats.loc[True].to_dict()
         }
 
         # Round values
@@ -202,20 +276,23 @@ class PerformanceAnalyzerAgent:
                 else:
                     weekday_weekend[period][metric] = round(float(weekday_weekend[period][metric]), 4)
         
-        # By Platform
-        platform_day_patterns = {}
-        for platform in df['platform'].unique():
-            platform_data = df[df['platform'] == platform]
+        # By Platform: platform x weekend cross-tab of mean CTR / engagement
+        cross = (
+            df.groupby(['platform', 'is_weekend'], observed=True)[['ctr', 'engagement_rate']]
+            .mean()
+            .unstack('is_weekend')
+            .reindex(columns=pd.MultiIndex.from_product([['ctr', 'engagement_rate'], [False, True]]))
+        )
+        cross.columns = ['weekday_avg_ctr', 'weekend_avg_ctr', 'weekday_avg_engagement', 'weekend_avg_engagement']
 
+        platform_day_patterns = {}
+        for row in cross.itertuples():
+            platform = row.Index
             platform_day_patterns[platform] = {
-                'weekday_avg_ctr': round(
-                    platform_data[~platform_data['is_weekend']]['ctr'].mean(), 4),
-                'weekend_avg_ctr': round(
-                    platform_data[platform_data['is_weekend']]['ctr'].mean(), 4),
-                'weekday_avg_engagement': round(
-                    platform_data[~platform_data['is_weekend']]['engagement_rate'].mean(), 4),
-                'weekend_avg_engagement': round(
-                    platform_data[platform_data['is_weekend']]['engagement_rate'].mean(), 4)
+                'weekday_avg_ctr': round(float(row.weekday_avg_ctr), 4),
+                'weekend_avg_ctr': round(float(row.weekend_avg_ctr), 4),
+                'weekday_avg_engagement': round(float(row.weekday_avg_engagement), 4),
+                'weekend_avg_engagement': round(float(row.weekend_avg_engagement), 4)
             }
 
             # Calculate improvement percentage
@@ -253,23 +330,26 @@ class PerformanceAnalyzerAgent:
             'spend':'sum'
         }).reset_index()
 
+        # Format dates once for every reported day
+        dialy_performance['date_str'] = dialy_performance['date'].dt.strftime('%Y-%m-%d')
+
         # Detect anomalies using z-score method
         for metric in ['impressions', 'clicks']:
-            mean_val = dialy_performance[metric].mean()
-            std_val = dialy_performance[metric].std()
+            daily_values = dialy_performance[metric]
+            mean_val = daily_values.mean()
+            std_val = daily_values.std()
 
             # High performance (>2 Std above mean)
             high_threshold = mean_val + (2 * std_val)
-            high_days = dialy_performance[dialy_performance[metric] > high_threshold]
-
-            if len(high_days) > 0:
-                for _, row in high_days.iterrows():
-                    anomalies['high_performance_days'].append({
-                        'date': row['date'].strftime('%Y-%m-%d'),
-                        'metric': metric,
-                        'value': int(row[metric]),
-                        'times_above_average': round(row[metric] / mean_val, 2)
-                    })
+            is_high = daily_values > high_threshold
+
+            high_days = pd.DataFrame({
+                'date': dialy_performance.loc[is_high, 'date_str'],
+                'metric': metric,
+                'value': daily_values[is_high].astype('int64'),
+                'times_above_average': (daily_values[is_high] / mean_val).round(2)
+            })
+            anomalies['high_performance_days'].extend(high_days.to_dict('records'))
         
         anomalies['summary'] = {
             'total_high_performance_days': len(anomalies['high_performance_days']),
@@ -286,9 +366,16 @@ class PerformanceAnalyzerAgent:
         print("🚀 Starting Performance Analyzer Agent...")
         print("=" * 60)
 
+        overall_kpis = self.calculate_overall_kpis()
+        platform_analysis = self.analyze_by_platform()
+
         self.analysis_results = {
-            'overall_kpis':self.calculate_overall_kpis(),
-            'platform_analysis':self.analyze_by_platform(),
+            'overall_kpis':overall_kpis,
+            'platform_analysis':platform_analysis,
+            'best_platform_by_ctr': max(
+                platform_analysis,
+                key=lambda platform: platform_analysis[platform]['avg_ctr']
+            ),
             'weekly_analysis':self.anlyze_by_week(),
             'creative_analysis': self.analyze_by_creative(),
             'day_of_week_analysis': self.analyze_day_of_week_patterns(),
@@ -302,12 +389,20 @@ class PerformanceAnalyzerAgent:
         
         return self.analysis_results
     
-    def save_analysis(self, output_path: str = 'data/processed/performance_analysis.json'):
-        """Save analysis results to JSON"""
+    def save_analysis(self, output_path: str = 'data/processed/performance_analysis.json',
+                      tables_dir: str = 'data/processed'):
+        """Save analysis results to JSON, plus Parquet tables for the dashboard."""
         if not self.analysis_results:
             raise Exception("No analysis results to save. Run analysis first.")
         
-        with open(output_path, 'w') as f:
-            json.dump(self.analysis_results, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(self.analysis_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
-        print(f"\n💾 Performance analysis saved to: {output_path}")
\ No newline at end of file
+        print(f"\n💾 Performance analysis saved to: {output_path}")
+
+        # Tabular sections as Parquet so the dashboard can load frames directly
+        for key in ANALYSIS_TABLES:
+            table_path = os.path.join(tables_dir, f"{key}.parquet")
+            table = pd.DataFrame.from_dict(self.analysis_results[key], orient='index')
+            table.to_parquet(table_path, engine='pyarrow')
+            print(f"💾 {key} table saved to: {table_path}")
\ No newline at end of file
@@ -3,15 +3,45 @@ Agent 6: Report Composer Agent
 Generates executive-ready written reports from campaign analysis and insights.
 """
 
-import json
-from typing import Dict, List
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from datetime import datetime
 import os
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
+from src.utils.openai_client import get_async_client, openai_session
 
 load_dotenv()
 
+# Sections of Agent 2's analysis that the report context reads
+ANALYSIS_SECTIONS = ('overall_kpis', 'platform_analysis', 'weekly_analysis')
+
+def _dumps(obj) -> str:
+    """Compact JSON for prompt text (numpy scalars allowed); the model needs no indentation."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def _write_bytes(path: str, data: bytes) -> str:
+    """Write data to path and return the path."""
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+def _platform_table(platforms: Dict) -> str:
+    """Platform metrics as a markdown table, far fewer tokens than a JSON dump."""
+    rows = [
+        "| Platform | Impressions | Reach | Clicks | Spend | Spend % | CPM | CTR | CPC | Engagement Rate | Frequency |",
+        "|---|---|---|---|---|---|---|---|---|---|---|"
+    ]
+    rows.extend(
+        f"| {platform} | {m['impressions']:,} | {m['reach']:,} | {m['clicks']:,} | ${m['spend']:,.2f} "
+        f"| {m['spend_percentage']}% | ${m['avg_cpm']} | {m['avg_ctr']:.2%} | ${m['cost_per_click']} "
+        f"| {m['avg_engagement_rate']:.2%} | {m['frequency']} |"
+        for platform, m in platforms.items()
+    )
+    return "\n".join(rows)
+
 class ReportComposerAgent:
     """
     Agent that generates professional written reports for marketing executives.
@@ -29,10 +59,32 @@ class ReportComposerAgent:
 
         self.analysis = performance_analysis
         self.insights = insights
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        self.report = {}
+        self.reports = {}
+        # Inputs don't change after init, so all four reports share one context string
+        self._context_cache: Optional[str] = None
     
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Connection-pooled OpenAI client of the running event loop (see src.utils.openai_client)."""
+        return get_async_client()
+
+    async def _stream_completion(self, **kwargs) -> str:
+        """Run a chat completion with streaming and return the full text."""
+        # Tokens are collected as they arrive instead of waiting for one complete body
+        stream = await self.client.chat.completions.create(**kwargs, stream=True)
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
     def _create_report_context(self) -> str:
+        """Return the report context, building it on first use."""
+        if self._context_cache is None:
+            self._context_cache = self._build_report_context()
+        return self._context_cache
+
+    def _build_report_context(self) -> str:
         """Create comprehensive context for report generation."""
 
         overall = self.analysis['overall_kpis']
@@ -53,24 +105,24 @@ class ReportComposerAgent:
         - Cost Per Click: ${overall['cost_per_click']} 
 
         PLATFORM PERFORMANCE:
-        {json.dumps(platforms, indent=2)}
+{_platform_table(platforms)}
 
         WEEKLLY TRENDS:
-        {json.dumps(weekly, indent=2)}
+        {_dumps(weekly)}
 
         TOP PRIORITY RECOMMENDATIONS:
-        {json.dumps(priority_recs[:5], indent=2)}
+        {_dumps(priority_recs[:5])}
 
         ALL INSIGHTS:
-        Budget Efficiency: {json.dumps(self.insights.get('budget_efficiency', []), indent=2)}
-        Creative Performance: {json.dumps(self.insights.get('creative_performance', []), indent=2)}
-        Ad Fatigue: {json.dumps(self.insights.get('ad_fatigue', []), indent=2)}
-        Platform Insights: {json.dumps(self.insights.get('platform_insights', []), indent=2)}
+        Budget Efficiency: {_dumps(self.insights.get('budget_efficiency', []))}
+        Creative Performance: {_dumps(self.insights.get('creative_performance', []))}
+        Ad Fatigue: {_dumps(self.insights.get('ad_fatigue', []))}
+        Platform Insights: {_dumps(self.insights.get('platform_insights', []))}
         """
 
         return context
     
-    def generate_executive_summary(self) -> str:
+    async def generate_executive_summary(self) -> str:
         """Generate a concise executive summary (1 page)."""
         print("\n📄 Generating executive summary...")
 
@@ -109,7 +161,7 @@ class ReportComposerAgent:
         Start with: # Executive Summary - BaliGlow Branc Awareness Campaign"""
 
         try:
-            response = self.client.chat.completions.create(
+            summary = await self._stream_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {"role":"system", "content":"You are a senior marketing analytics director writing for C-level executives."},
@@ -119,8 +171,6 @@ class ReportComposerAgent:
                 max_tokens=800
             )
 
-            summary = response.choices[0].message.content
-
             print(f"✅ Executive summary generated ({len(summary)} characters)")
             return summary
         
@@ -128,7 +178,7 @@ class ReportComposerAgent:
             print(f"❌ Error generating executive summary: {str(e)}")
             return ""
     
-    def generate_detailed_analysis(self) -> str:
+    async def generate_detailed_analysis(self) -> str:
         """Generate detailed analytical report (2-3 pages)."""
         print("\n📊 Generating detailed analysis report...")
 
@@ -175,7 +225,7 @@ class ReportComposerAgent:
         Start with: # Detailed Campaign Analysis - BaliGlow Q4 Brand Awareness"""
 
         try:
-            response = self.client.chat.completions.create(
+            summary = await self._stream_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {"role":"system", "content":"You are a marketing analyst writing detailed performance reports."},
@@ -185,8 +235,6 @@ class ReportComposerAgent:
                 max_tokens=1500
             )
 
-            summary = response.choices[0].message.content
-
             print(f"✅ Detailed Analysis generated ({len(summary)} characters)")
             return summary
         
@@ -194,11 +242,11 @@ class ReportComposerAgent:
             print(f"❌ Error generating detailed Analysis: {str(e)}")
             return ""
     
-    def generate_action_plan(self) -> str:
+    async def generate_action_plan(self) -> str:
         """Generate actionable recommendations report."""
         print("\n🎯 Generating action plan...")
 
-        context = self._create_report_context
+        context = self._create_report_context()
 
         prompt = f"""You are a marketing strategist creating an action plan based on campaign analysis.
 
@@ -231,7 +279,7 @@ class ReportComposerAgent:
         Start with: # Action Plan - BaliGlow Campaign Optimizations"""
             
         try:
-            response = self.client.chat.completions.create(
+            action_plan = await self._stream_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a marketing strategist creating actionable plans."},
@@ -241,8 +289,6 @@ class ReportComposerAgent:
                 max_tokens=1000
             )
             
-            action_plan = response.choices[0].message.content
-            
             print(f"✅ Action plan generated ({len(action_plan)} characters)")
             return action_plan
             
@@ -250,11 +296,11 @@ class ReportComposerAgent:
             print(f"❌ Error generating action plan: {str(e)}")
             return ""
     
-    def generate_client_report(self) -> str:
+    async def generate_client_report(self) -> str:
         """Generate client-facing report (simplified, positive tone)."""
         print("\n👥 Generating client-facing report...")
 
-        context = self._create_report_context
+        context = self._create_report_context()
 
         prompt = f"""You are writing a report for the client (BaliGlow brand owner) who is not a marketing expert.
 
@@ -291,7 +337,7 @@ class ReportComposerAgent:
         Start with: # BaliGlow Campaign Performance Report"""
 
         try:
-            response = self.client.chat.completions.create(
+            client_report = await self._stream_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a marketing consultant communicating with a non-technical client."},
@@ -301,8 +347,6 @@ class ReportComposerAgent:
                 max_tokens=900
             )
             
-            client_report = response.choices[0].message.content
-            
             print(f"✅ Client report generated ({len(client_report)} characters)")
             return client_report
             
@@ -310,20 +354,34 @@ class ReportComposerAgent:
             print(f"❌ Error generating client report: {str(e)}")
             return ""
     
+    async def _generate_all(self):
+        """Issue the four independent report calls concurrently."""
+        async with openai_session():
+            return await asyncio.gather(
+                self.generate_executive_summary(),
+                self.generate_detailed_analysis(),
+                self.generate_action_plan(),
+                self.generate_client_report()
+            )
+
     def run(self) -> Dict[str, str]:
         """Generate all report types."""
         print("🚀 Starting Report Composer Agent...")
         print("=" * 60)
         print("⏳ Generating 4 different report formats...")
-        print("   This will take 60-90 seconds (4 AI calls)")
+        print("   4 AI calls run concurrently, so this takes about as long as the slowest one")
         print("")
 
-        # Generate all reports
+        # Generate all reports concurrently
+        executive_summary, detailed_analysis, action_plan, client_report = asyncio.run(
+            self._generate_all()
+        )
+
         self.reports = {
-            'executive_summary': self.generate_executive_summary(),
-            'detailed_analysis': self.generate_detailed_analysis(),
-            'action_plan': self.generate_action_plan(),
-            'client_report': self.generate_client_report(),
+            'executive_summary': executive_summary,
+            'detailed_analysis': detailed_analysis,
+            'action_plan': action_plan,
+            'client_report': client_report,
             'metadata': {
                 'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'campaign_name': 'BaliGlow Brand Awareness Q4'
@@ -338,7 +396,10 @@ class ReportComposerAgent:
         return self.reports
     
     def save_reports(self, output_dir: str = 'data/outputs/reports'):
-        """Save all reports to separate files."""
+        """
+        Save all reports to separate files.
+        Returns: dict of report name -> saved file path
+        """
         import os
 
         # Create output directory if it doesn't exist
@@ -347,42 +408,41 @@ class ReportComposerAgent:
         if not self.reports:
             raise Exception("No reports to save. Run generation first.")
         
-        # Save each report type
+        # Collect every output first, then write them concurrently (file I/O releases the GIL)
         report_files = {}
+        outputs = {}
 
+        # Each report type
         for report_type, content in self.reports.items():
             if report_type == 'metadata':
                 continue
 
             filename = f"{report_type}.md"
             filepath = os.path.join(output_dir, filename)
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
             report_files[report_type] = filepath
-            print(f"💾 Saved: {filepath}")
+            outputs[filepath] = content.encode('utf-8')
         
-        # Save combined report
+        # Combined report
         combined_path = os.path.join(output_dir, 'complete_report.md')
-        with open(combined_path, 'w', encoding='utf-8') as f:
-            f.write("# CampaignIQ Complete Report\n\n")
-            f.write(f"Generated: {self.reports['metadata']['generated_at']}\n\n")
-            f.write("---\n\n")
-
-            for report_type, content in self.reports.items():
-                if report_type == 'metadata':
-                    continue
-                f.write(content)
-                f.write("\n\n--\n\n")
-        
+        parts = [
+            "# CampaignIQ Complete Report\n\n",
+            f"Generated: {self.reports['metadata']['generated_at']}\n\n",
+            "---\n\n"
+        ]
+        parts.extend(
+            content + "\n\n--\n\n"
+            for report_type, content in self.reports.items()
+            if report_type != 'metadata'
+        )
         report_files['complete_report'] = combined_path
-        print(f"💾 Saved: {combined_path}")
+        outputs[combined_path] = "".join(parts).encode('utf-8')
 
-        # Save as JSOn for programmatic access
+        # JSON for programmatic access
         json_path = os.path.join(output_dir, 'reports.json')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.report, f, indent=2)
-        print(f"💾 Saved: {json_path}")
+        outputs[json_path] = orjson.dumps(self.reports, option=orjson.OPT_INDENT_2)
+
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            for filepath in executor.map(_write_bytes, outputs.keys(), outputs.values()):
+                print(f"💾 Saved: {filepath}")
 
-        f"💾 Saved: {json_path}"
\ No newline at end of file
+        return report_files
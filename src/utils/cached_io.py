@@ -0,0 +1,55 @@
+"""
+Cached loaders for the files agents hand to each other.
+Parsed results are kept per (path, mtime, size), so a file that has not changed on
+disk is only parsed once per process. Cached objects are shared: treat them as read-only.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+import orjson
+
+# pandas is imported on first Parquet read, so JSON-only callers never pay for it
+if TYPE_CHECKING:
+    import pandas as pd
+
+def _file_key(path: str):
+    """Cache key that changes whenever the file is rewritten."""
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+@lru_cache(maxsize=16)
+def _load_json(path: str, mtime_ns: int, size: int):
+    return orjson.loads(Path(path).read_bytes())
+
+@lru_cache(maxsize=16)
+def _load_json_sections(path: str, mtime_ns: int, size: int, keys: Tuple[str, ...]) -> dict:
+    # One orjson C parse of these few-hundred-KB files beats an ijson event stream,
+    # which would build every section anyway before the key filter
+    document = _load_json(path, mtime_ns, size)
+    return {key: document[key] for key in keys if key in document}
+
+@lru_cache(maxsize=8)
+def _load_parquet(path: str, mtime_ns: int, size: int, columns: Optional[Tuple[str, ...]]) -> 'pd.DataFrame':
+    import pandas as pd
+    return pd.read_parquet(path, engine='pyarrow', columns=list(columns) if columns else None)
+
+def load_json_cached(path: str):
+    """Parse a JSON file, reusing the previous result if the file is unchanged."""
+    return _load_json(*_file_key(path))
+
+def load_json_sections_cached(path: str, keys: Tuple[str, ...]) -> dict:
+    """
+    Return only the given top-level sections of a JSON object, reusing the previous
+    result if the file is unchanged. The file is parsed whole; the other sections
+    are simply not handed to the caller.
+    """
+    return _load_json_sections(*_file_key(path), tuple(keys))
+
+def load_parquet_cached(path: str, columns: Optional[Tuple[str, ...]] = None) -> 'pd.DataFrame':
+    """
+    Read a Parquet file, reusing the previous frame if the file is unchanged.
+    Pass columns to read only those columns (Parquet is columnar, so the rest are never decoded).
+    """
+    return _load_parquet(*_file_key(path), tuple(columns) if columns else None)
@@ -1,8 +1,25 @@
 import pandas as pd 
 import numpy as np 
-from datetime import datetime, timedelta
+from datetime import datetime
 import yaml
-import random
+
+# Dtypes for the generated frame (matches what Agent 1 reads back): low-cardinality
+# labels as categories, narrow metrics; spend keeps float64 precision for budget totals
+COLUMN_DTYPES = {
+    'campaign_id': 'category',
+    'campaign_name': 'category',
+    'brand_name': 'category',
+    'platform': 'category',
+    'creative_id': 'category',
+    'impressions': 'int32',
+    'reach': 'int32',
+    'clicks': 'int32',
+    'engagements': 'int32',
+    'video_views': 'int32',
+    'cpm': 'float32',
+    'ctr': 'float32',
+    'engagement_rate': 'float32'
+}
 
 class CampaignDataGenerator:
     """
@@ -22,9 +39,6 @@ class CampaignDataGenerator:
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
 
-        np.random.seed(42)
-        random.seed(42)
-
         # Extract config value
         self.campaign_config = self.config['campaign']
         self.platforms_config = self.config['platforms']
@@ -41,64 +55,68 @@ class CampaignDataGenerator:
 
         # Platform names
         self.platforms = ['google_display', 'meta', 'tiktok']
+
+        # Fixed seed for reproducible data; generate_campaign_data derives its
+        # PCG64 streams from it afresh on every call
+        self.seed = 42
+        self._reset_rngs()
+    
+    def _reset_rngs(self):
+        """
+        Rebuild the seeded streams: self.rng for dataset-level draws and one
+        independent child stream per platform.
+        """
+        seed_sequence = np.random.SeedSequence(self.seed)
+        self.rng = np.random.default_rng(seed_sequence)
+        self.platform_rngs = [np.random.default_rng(seed) for seed in seed_sequence.spawn(len(self.platforms))]
     
-    def _get_date_features(self, date):
-        """Extract features from date for pattern generation."""
-        day_of_week = date.weekday()  # 0=Monday, 6=Sunday
-        is_weekend = day_of_week >= 5
-        days_since_start = (date - self.start_date).days
-        week_number = days_since_start // 7 + 1
+    def _get_date_features(self):
+        """Extract features for every campaign day as arrays (one entry per day)."""
+        dates = pd.date_range(self.start_date, periods=self.duration_days, freq='D')
+        days_since_start = np.arange(self.duration_days)
         
         return {
-            'day_of_week': day_of_week,
-            'is_weekend': is_weekend,
+            'date': dates.to_numpy(),  # datetime64[ns], no per-row string formatting
+            'day_of_week': dates.dayofweek.to_numpy(),  # 0=Monday, 6=Sunday
+            'is_weekend': dates.dayofweek.to_numpy() >= 5,
             'days_since_start': days_since_start,
-            'week_number': week_number
+            'week_number': days_since_start // 7 + 1
         }
     
     def _calculate_learning_phase_multiplier(self, days_since_start):
         """
         Learning phase: First 7 days have suboptimal performance.
         CPM is higher, CTR is lower as algorithms learn.
+        Returns (cpm_multiplier, ctr_multiplier) arrays; 1.0 from day 7 on.
         """
-        if days_since_start >= 7:
-            return 1.0  # Normal performance
+        learning = days_since_start < 7
         
         # Gradual improvement from day 0 to day 7
         # Day 0: 1.3x CPM, Day 7: 1.0x CPM
-        cpm_multiplier = 1.3 - (days_since_start * 0.3 / 7)
-        ctr_multiplier = 0.85 + (days_since_start * 0.15 / 7)
+        cpm_multiplier = np.where(learning, 1.3 - (days_since_start * 0.3 / 7), 1.0)
+        ctr_multiplier = np.where(learning, 0.85 + (days_since_start * 0.15 / 7), 1.0)
         
-        return {
-            'cpm_multiplier': cpm_multiplier,
-            'ctr_multiplier': ctr_multiplier
-        }
+        return cpm_multiplier, ctr_multiplier
     
-    def _calculate_ad_fatigue_multiplier(self, week_number):
+    def _calculate_ad_fatigue_multiplier(self, week_number, shape, rng):
         """
         Ad fatigue: Performance degrades in week 4.
         CTR and engagement drop as audience sees ads repeatedly.
+        Returns (ctr_multiplier, engagement_multiplier) arrays of the given shape.
         """
-        if week_number <= 3:
-            return 1.0  # No fatigue
+        fatigued = week_number > 3
         
         # Week 4: reduce CTR by 15-25%, engagement by 10-20%
-        ctr_multiplier = np.random.uniform(0.75, 0.85)
-        engagement_multiplier = np.random.uniform(0.80, 0.90)
+        ctr_multiplier = np.where(fatigued, rng.uniform(0.75, 0.85, size=shape), 1.0)
+        engagement_multiplier = np.where(fatigued, rng.uniform(0.80, 0.90, size=shape), 1.0)
         
-        return {
-            'ctr_multiplier': ctr_multiplier,
-            'engagement_multiplier': engagement_multiplier
-        }
+        return ctr_multiplier, engagement_multiplier
     
     def _calculate_day_of_week_multiplier(self, platform, is_weekend):
         """
         Day-of-week effects: Weekends perform differently.
         B2C beauty brand sees different behavior on weekends.
         """
-        if not is_weekend:
-            return 1.0  # Baseline weekday performance
-        
         # Weekend multipliers by platform
         weekend_effects = {
             'google_display': 0.95,  # Slightly lower on weekends
@@ -106,9 +124,10 @@ class CampaignDataGenerator:
             'tiktok': 1.20  # Much better on weekends
         }
         
-        return weekend_effects.get(platform, 1.0)
+        # Weekdays are the baseline
+        return np.where(is_weekend, weekend_effects.get(platform, 1.0), 1.0)
     
-    def _get_creative_multiplier(self, creative_id):
+    def _get_creative_multiplier(self, creative_ids):
         """
         Creative variance: Some ads perform better than others.
         Creative 1: Best (+30%)
@@ -121,18 +140,16 @@ class CampaignDataGenerator:
             3: 0.80   # Underperformer
         }
         
-        return creative_multipliers.get(creative_id, 1.0)
+        return np.array([creative_multipliers.get(creative_id, 1.0) for creative_id in creative_ids])
     
-    def _generate_daily_metrics(self, date, platform, creative_id, platform_config):
+    def _generate_platform_metrics(self, platform, platform_config, rng):
         """
-        Generate daily performance metrics for a specific platform and creative.
-        Applies all realistic patterns (learning phase, fatigue, day-of-week, creative variance).
+        Generate daily performance metrics for every creative of a platform at once.
+        Returns each column as a (creatives x days) grid. Applies all realistic
+        patterns (learning phase, fatigue, day-of-week, creative variance).
         """
         # Get date features
-        date_features = self._get_date_features(date)
-        days_since_start = date_features['days_since_start']
-        week_number = date_features['week_number']
-        is_weekend = date_features['is_weekend']
+        date_features = self._get_date_features()
         
         # Get baseline metrics from config
         baseline_cpm = platform_config['avg_cpm']
@@ -147,175 +164,146 @@ class CampaignDataGenerator:
             self.duration_days / 
             num_creatives
         )
+        creative_ids = np.arange(1, num_creatives + 1)
+        shape = (num_creatives, self.duration_days)
         
         # Apply pattern multipliers
         
         # 1. Learning phase
-        learning_mult = self._calculate_learning_phase_multiplier(days_since_start)
-        if isinstance(learning_mult, dict):
-            cpm = baseline_cpm * learning_mult['cpm_multiplier']
-            ctr = baseline_ctr * learning_mult['ctr_multiplier']
-        else:
-            cpm = baseline_cpm
-            ctr = baseline_ctr
+        cpm_learning, ctr_learning = self._calculate_learning_phase_multiplier(
+            date_features['days_since_start']
+        )
+        cpm = np.broadcast_to(baseline_cpm * cpm_learning, shape)
+        ctr = np.broadcast_to(baseline_ctr * ctr_learning, shape)
         
         # 2. Ad fatigue (week 4)
-        fatigue_mult = self._calculate_ad_fatigue_multiplier(week_number)
-        if isinstance(fatigue_mult, dict):
-            ctr *= fatigue_mult['ctr_multiplier']
-            engagement_rate = baseline_engagement * fatigue_mult['engagement_multiplier']
-        else:
-            engagement_rate = baseline_engagement
+        ctr_fatigue, engagement_fatigue = self._calculate_ad_fatigue_multiplier(
+            date_features['week_number'], shape, rng
+        )
+        ctr = ctr * ctr_fatigue
+        engagement_rate = baseline_engagement * engagement_fatigue
         
         # 3. Day-of-week effects
-        dow_mult = self._calculate_day_of_week_multiplier(platform, is_weekend)
-        ctr *= dow_mult
-        engagement_rate *= dow_mult
+        dow_mult = self._calculate_day_of_week_multiplier(platform, date_features['is_weekend'])
+        ctr = ctr * dow_mult
+        engagement_rate = engagement_rate * dow_mult
         
-        # 4. Creative variance
-        creative_mult = self._get_creative_multiplier(creative_id)
-        ctr *= creative_mult
-        engagement_rate *= creative_mult
+        # 4. Creative variance (one row per creative)
+        creative_mult = self._get_creative_multiplier(creative_ids)[:, np.newaxis]
+        ctr = ctr * creative_mult
+        engagement_rate = engagement_rate * creative_mult
         
         # Add random noise (±10%) to make it realistic
-        cpm *= np.random.uniform(0.90, 1.10)
-        ctr *= np.random.uniform(0.90, 1.10)
-        engagement_rate *= np.random.uniform(0.90, 1.10)
+        cpm_noise, ctr_noise, engagement_noise = rng.uniform(0.90, 1.10, size=(3, *shape))
+        cpm = cpm * cpm_noise
+        ctr = ctr * ctr_noise
+        engagement_rate = engagement_rate * engagement_noise
         
         # Calculate actual spend (slight variation from planned budget)
-        actual_spend = platform_daily_budget * np.random.uniform(0.95, 1.05)
+        actual_spend = platform_daily_budget * rng.uniform(0.95, 1.05, size=shape)
         
         # Calculate other metrics based on spend and CPM
-        impressions = int((actual_spend / cpm) * 1000)
+        impressions = ((actual_spend / cpm) * 1000).astype(np.int64)
         
         # Reach is typically 70-90% of impressions (frequency > 1)
-        reach = int(impressions * np.random.uniform(0.70, 0.90))
+        reach = (impressions * rng.uniform(0.70, 0.90, size=shape)).astype(np.int64)
         
         # Clicks based on CTR
-        clicks = int(impressions * ctr)
+        clicks = (impressions * ctr).astype(np.int64)
         
         # Engagements based on engagement rate (only for social platforms)
-        if platform in ['meta', 'tiktok']:
-            engagements = int(impressions * engagement_rate)
+        is_social = platform in ['meta', 'tiktok']
+        if is_social:
+            engagements = (impressions * engagement_rate).astype(np.int64)
         else:
-            engagements = 0
+            engagements = np.zeros(shape, dtype=np.int64)
         
         # Video views (80-95% of impressions for video ads)
-        video_views = int(impressions * np.random.uniform(0.80, 0.95))
+        video_views = (impressions * rng.uniform(0.80, 0.95, size=shape)).astype(np.int64)
         
         return {
-            'date': date.strftime('%Y-%m-%d'),
-            'platform': platform,
-            'creative_id': f"{platform}_creative_{creative_id}",
+            'date': np.broadcast_to(date_features['date'], shape),
+            'platform': np.full(shape, platform, dtype=object),
+            'creative_id': np.broadcast_to(
+                np.array([f"{platform}_creative_{i}" for i in creative_ids], dtype=object)[:, np.newaxis],
+                shape
+            ),
             'impressions': impressions,
             'reach': reach,
             'clicks': clicks,
-            'spend': round(actual_spend, 2),
+            'spend': np.round(actual_spend, 2),
             'engagements': engagements,
             'video_views': video_views,
-            'cpm': round(cpm, 2),
-            'ctr': round(ctr, 4),
-            'engagement_rate': round(engagement_rate, 4) if platform in ['meta', 'tiktok'] else 0
+            'cpm': np.round(cpm, 2),
+            'ctr': np.round(ctr, 4),
+            'engagement_rate': np.round(engagement_rate, 4) if is_social else np.zeros(shape)
         }
     
     def _add_data_quality_issues(self, df):
         """
-        Add realistic data quality issues:
+        Add realistic data quality issues (modifies df in place):
         1. Missing days (1-2 per platform - reporting delays)
         2. Outlier days (1 day with unusually high performance)
         """
-        df_modified = df.copy()
-        
-        # 1. Add missing days (remove 1-2 random days per platform)
+        # 1. Add missing days (remove 1-2 random days per platform), one drop for all platforms
+        rows_to_drop = []
         for platform in self.platforms:
-            platform_data = df_modified[df_modified['platform'] == platform]
+            platform_data = df[df['platform'] == platform]
             if len(platform_data) > 5:  # Only if we have enough data
-                num_missing = random.randint(1, 2)
-                rows_to_drop = platform_data.sample(n=num_missing).index
-                df_modified = df_modified.drop(rows_to_drop)
+                num_missing = int(self.rng.integers(1, 3))
+                rows_to_drop.extend(platform_data.sample(n=num_missing, random_state=self.rng).index)
+        df.drop(index=rows_to_drop, inplace=True)
         
         # 2. Add one outlier day (viral post effect - 2-3x normal performance)
-        outlier_idx = df_modified.sample(n=1).index[0]
-        multiplier = np.random.uniform(2.0, 3.0)
+        outlier_pos = int(self.rng.integers(0, len(df)))
+        multiplier = self.rng.uniform(2.0, 3.0)
         
-        df_modified.loc[outlier_idx, 'impressions'] = int(
-            df_modified.loc[outlier_idx, 'impressions'] * multiplier
-        )
-        df_modified.loc[outlier_idx, 'reach'] = int(
-            df_modified.loc[outlier_idx, 'reach'] * multiplier
-        )
-        df_modified.loc[outlier_idx, 'clicks'] = int(
-            df_modified.loc[outlier_idx, 'clicks'] * multiplier
-        )
-        df_modified.loc[outlier_idx, 'engagements'] = int(
-            df_modified.loc[outlier_idx, 'engagements'] * multiplier
-        )
-        df_modified.loc[outlier_idx, 'video_views'] = int(
-            df_modified.loc[outlier_idx, 'video_views'] * multiplier
-        )
+        # Positional access on the outlier row: column positions looked up once
+        count_columns = df.columns.get_indexer(['impressions', 'reach', 'clicks', 'engagements', 'video_views'])
+        spend_col, cpm_col, ctr_col = df.columns.get_indexer(['spend', 'cpm', 'ctr'])
+        scaled = (df.iloc[outlier_pos, count_columns].to_numpy(dtype=float) * multiplier).astype(int)
+        df.iloc[outlier_pos, count_columns] = scaled
+        impressions, clicks = scaled[0], scaled[2]
         
         # Recalculate CPM and CTR for outlier day
-        df_modified.loc[outlier_idx, 'cpm'] = round(
-            df_modified.loc[outlier_idx, 'spend'] / 
-            df_modified.loc[outlier_idx, 'impressions'] * 1000, 2
-        )
-        df_modified.loc[outlier_idx, 'ctr'] = round(
-            df_modified.loc[outlier_idx, 'clicks'] / 
-            df_modified.loc[outlier_idx, 'impressions'], 4
-        )
+        df.iat[outlier_pos, cpm_col] = round(df.iat[outlier_pos, spend_col] / impressions * 1000, 2)
+        df.iat[outlier_pos, ctr_col] = round(clicks / impressions, 4)
         
-        return df_modified
+        return df
     
     def generate_campaign_data(self):
         """
         Main method to generate complete campaign dataset.
         Returns a pandas DataFrame with all daily performance data.
         """
-        all_data = []
-        
-        # Generate data for each platform
-        for platform in self.platforms:
-            platform_config = self.platforms_config[platform]
-            num_creatives = platform_config['num_creatives']
-            
-            # For each creative
-            for creative_id in range(1, num_creatives + 1):
-                
-                # For each day in campaign
-                for day in range(self.duration_days):
-                    current_date = self.start_date + timedelta(days=day)
-                    
-                    # Generate daily metrics
-                    daily_metrics = self._generate_daily_metrics(
-                        date=current_date,
-                        platform=platform,
-                        creative_id=creative_id,
-                        platform_config=platform_config
-                    )
-                    
-                    all_data.append(daily_metrics)
+        # Same seed, same data: start from fresh streams on every call
+        self._reset_rngs()
         
-        # Convert to DataFrame
-        df = pd.DataFrame(all_data)
+        # Generate data for each platform, all creatives and days at once
+        grids = [
+            self._generate_platform_metrics(platform, self.platforms_config[platform], rng)
+            for platform, rng in zip(self.platforms, self.platform_rngs)
+        ]
         
-        # Add campaign metadata
-        df['campaign_id'] = 'CAMP_001'
-        df['campaign_name'] = self.campaign_name
-        df['brand_name'] = self.brand_name
+        # Stack the platforms' creatives, then flatten day by day so rows come out
+        # ordered by date, platform and creative without a sort (self.platforms and
+        # the creative numbers are already in that order)
+        columns = {
+            column: np.concatenate([grid[column] for grid in grids]).T.ravel()
+            for column in grids[0]
+        }
         
-        # Reorder columns for better readability
-        column_order = [
-            'campaign_id', 'campaign_name', 'brand_name', 'date', 
-            'platform', 'creative_id', 'impressions', 'reach', 'clicks', 
-            'spend', 'engagements', 'video_views', 'cpm', 'ctr', 'engagement_rate'
-        ]
-        df = df[column_order]
+        # Add campaign metadata, columns in reading order
+        df = pd.DataFrame({
+            'campaign_id': 'CAMP_001',
+            'campaign_name': self.campaign_name,
+            'brand_name': self.brand_name,
+            **columns
+        }).astype(COLUMN_DTYPES)
         
         # Add data quality issues
         df = self._add_data_quality_issues(df)
-        
-        # Sort by date and platform
-        df = df.sort_values(['date', 'platform', 'creative_id']).reset_index(drop=True)
+        df.reset_index(drop=True, inplace=True)
         
         return df
     
@@ -325,6 +313,6 @@ class CampaignDataGenerator:
         df.to_csv(output_path, index=False)
         print(f"✅ Campaign data saved to {output_path}")
         print(f"📊 Generated {len(df)} rows of data")
-        print(f"📅 Date range: {df['date'].min()} to {df['date'].max()}")
+        print(f"📅 Date range: {df['date'].min():%Y-%m-%d} to {df['date'].max():%Y-%m-%d}")
         print(f"💰 Total spend: ${df['spend'].sum():,.2f}")
         return output_path
\ No newline at end of file
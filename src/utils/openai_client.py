@@ -0,0 +1,55 @@
+"""
+Shared OpenAI client for the AI agents.
+Keeps one pooled HTTP/2 connection set per event loop, so the concurrent API calls
+of an agent run reuse warm connections. Open it with `async with openai_session()`
+so the pool is closed before its loop is torn down.
+"""
+
+import asyncio
+import os
+import weakref
+from contextlib import asynccontextmanager
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+# Load environtment variables
+load_dotenv()
+
+# Transient failures (429, 5xx, timeouts, dropped connections) are retried by
+# the SDK with exponential backoff and jitter before a call gives up
+MAX_RETRIES = 5
+
+# httpx async pools are bound to the event loop that opened them, so keep one
+# client per loop instead of a single module-level instance.
+_clients = weakref.WeakKeyDictionary()
+
+def get_async_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            max_retries=MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+            )
+        )
+        _clients[loop] = client
+    return client
+
+@asynccontextmanager
+async def openai_session():
+    """
+    Open the shared client for the running event loop and close it on exit.
+    Wrap the coroutine each agent hands to asyncio.run in this, so the
+    HTTP/2 connections are released while their loop is still running.
+    """
+    client = get_async_client()
+    try:
+        yield client
+    finally:
+        _clients.pop(asyncio.get_running_loop(), None)
+        await client.close()
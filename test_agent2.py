@@ -2,9 +2,10 @@
 Test script for Performance Analyzer Agent (Agent 2)
 """
 
-import pandas as pd
+import heapq
+import io
+import sys
 from src.agents.performance_analyzer import PerformanceAnalyzerAgent
-import json
 
 def main():
     print("🧪 Testing Performance Analyzer Agent")
@@ -12,12 +13,9 @@ def main():
 
     # Load processed data from agent 1
     print("📥 Loading processed data from Agent 1...")
-    processed_data = pd.read_csv('data/processed/campaign_data_processed.csv')
-    processed_data['date'] = pd.to_datetime(processed_data['date'])
-    print(f"✅ Loaded {len(processed_data)} rows\n")
-
-    # Initialize agent 2
-    agent = PerformanceAnalyzerAgent(processed_data=processed_data)
+    # Initialize agent 2 (it reads the file itself, so no copy is kept here)
+    agent = PerformanceAnalyzerAgent.from_path('data/processed/campaign_data_processed.parquet')
+    print(f"✅ Loaded {len(agent.data)} rows\n")
 
     # Run Analysis
     result = agent.run()
@@ -25,47 +23,51 @@ def main():
     # Save Analysis
     agent.save_analysis()
 
-    # Display key insights
-    print("\n" + "=" * 70)
-    print("📋 KEY PERFORMANCE INSIGHTS")
-    print("=" * 70)
+    # Display key insights (buffered, written to stdout once)
+    out = io.StringIO()
+    print("\n" + "=" * 70, file=out)
+    print("📋 KEY PERFORMANCE INSIGHTS", file=out)
+    print("=" * 70, file=out)
 
-    print("\n🎯 Platform Performance:")
+    print("\n🎯 Platform Performance:", file=out)
     for platform, metrics in result['platform_analysis'].items():
-        print(f"\n    {platform.upper()}:")
-        print(f"      CTR: {metrics['avg_ctr']:.2%}")
-        print(f"      CPM: ${metrics['avg_cpm']}")
-        print(f"      CPC: ${metrics['cost_per_click']}")
-        print(f"      Spend Share: {metrics['spend_percentage']}%")
-
-    print("\📅 Weekly Trends:")
-    for week_key in sorted(result['weekly_analysis'].keys()):
-        week = result['weekly_analysis'][week_key]
+        print(f"\n    {platform.upper()}:", file=out)
+        print(f"      CTR: {metrics['avg_ctr']:.2%}", file=out)
+        print(f"      CPM: ${metrics['avg_cpm']}", file=out)
+        print(f"      CPC: ${metrics['cost_per_click']}", file=out)
+        print(f"      Spend Share: {metrics['spend_percentage']}%", file=out)
 
+    print("\n📅 Weekly Trends:", file=out)
+    # Weeks are stored in week order already; sorting the keys would put week_10 before week_2
+    for week in result['weekly_analysis'].values():
         change_indicator = ""
         if 'ctr_change_pct' in week:
             change = week['ctr_change_pct']
             change_indicator = f" (CTR: {'+' if change > 0 else ''}{change}%)"
         print(f"    Week {week['week_number']}: "
-            f"CTR {week['avg_ctr']:.2%}{change_indicator}")
+            f"CTR {week['avg_ctr']:.2%}{change_indicator}", file=out)
     
-    print("\n🎨 Creative Performance (Top 3 by CTR):")
-    creative_sorted = sorted(
+    print("\n🎨 Creative Performance (Top 3 by CTR):", file=out)
+    creative_sorted = heapq.nlargest(
+        3,
         result['creative_analysis'].items(),
-        key=lambda x: x[1]['avg_ctr'],
-        reverse=True
-    )[:3]
-    for creative_id, metrics in creative_sorted:
-        print(f"   {creative_id}: CTR {metrics['avg_ctr']:.2%} "
-              f"(Rank #{metrics['rank_by_ctr']} on {metrics['platform']})")
+        key=lambda x: x[1]['avg_ctr']
+    )
+    print("\n".join(
+        f"   {creative_id}: CTR {metrics['avg_ctr']:.2%} "
+        f"(Rank #{metrics['rank_by_ctr']} on {metrics['platform']})"
+        for creative_id, metrics in creative_sorted
+    ), file=out)
     
-    print("\n⚡ Anomalies:")
+    print("\n⚡ Anomalies:", file=out)
     if result['anomalies']['high_performance_days']:
         print(f"    {result['anomalies']['summary']['total_high_performance_days']}"
-            "high-performance day(s) detected:")
+            "high-performance day(s) detected:", file=out)
         for anomaly in result['anomalies']['high_performance_days'][:3]:
             print(f"    {anomaly['date']}: {anomaly['metric']} = {anomaly['value']:,}"
-            f"{anomaly['times_above_average']} x average")
+            f"{anomaly['times_above_average']} x average", file=out)
+
+    sys.stdout.write(out.getvalue())
 
     print("\n✅ Agent 2 testing complete!")
     print("🎯 Next: Build Agent 3 (Insight Generator)\n")
@@ -2,42 +2,62 @@
 Test script for Insight Generator Agent (Agent 3)
 """
 
-import json
-from src.agents.insight_generator import InsightGeneratorAgent
+import hashlib
+import io
+import os
+import sys
+from pathlib import Path
+import orjson
 
-def print_insight_safely(insight, index=None):
-    """Safely print insight with fallback for missing keys."""
+# Key names the model has used for each insight field, most common first
+_INSIGHT_KEYS = ('insight', 'observation', 'finding')
+_IMPACT_KEYS = ('impact', 'business_impact', 'why_it_matters')
+_RECOMMENDATION_KEYS = ('recommendation', 'action', 'suggested_action')
+
+def _first_value(insight, keys, default):
+    """Return the first non-empty value among keys, else default."""
+    return next((insight[key] for key in keys if insight.get(key)), default)
+
+def _present_value(rec, keys, default='N/A'):
+    """Return the value of the first key present in rec, else default."""
+    return next((rec[key] for key in keys if key in rec), default)
+
+# Replies already paid for, keyed by a hash of the analysis they were generated from.
+# Delete the folder to force fresh insights (e.g. after changing the prompt).
+LLM_CACHE_DIR = 'data/processed/.llm_cache'
+
+def _cache_path(performance_analysis):
+    """Cache file for this analysis; key order does not change the hash."""
+    key = hashlib.blake2b(
+        orjson.dumps(performance_analysis, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+    return os.path.join(LLM_CACHE_DIR, f"{key}.json")
+
+# One row of the priority recommendations display
+_PRIORITY_TEMPLATE = (
+    "\n#{rank}. {insight}\n"
+    "    Action: {action}\n"
+    "    Impact: {impact}\n"
+    "    Urgency: {urgency}\n"
+)
+
+def print_insight_safely(insight, index=None, out=None):
+    """Safely print insight with fallback for missing keys (to out, default stdout)."""
     prefix = f"{index}. " if index else ""
     
-    # Try different possible key names
-    insight_text = (
-        insight.get('insight') or 
-        insight.get('observation') or 
-        insight.get('finding') or 
-        'No insight text available'
-    )
-    
-    impact_text = (
-        insight.get('impact') or 
-        insight.get('business_impact') or 
-        insight.get('why_it_matters') or 
-        'Impact not specified'
-    )
-    
-    recommendation_text = (
-        insight.get('recommendation') or 
-        insight.get('action') or 
-        insight.get('suggested_action') or 
-        'No recommendation provided'
-    )
+    # Try different possible key names (first non-empty value wins)
+    insight_text = _first_value(insight, _INSIGHT_KEYS, 'No insight text available')
+    impact_text = _first_value(insight, _IMPACT_KEYS, 'Impact not specified')
+    recommendation_text = _first_value(insight, _RECOMMENDATION_KEYS, 'No recommendation provided')
     
     priority = insight.get('priority', 'medium')
     
-    print(f"\n{prefix}{insight_text}")
-    print(f"   Impact: {impact_text}")
-    print(f"   Recommendation: {recommendation_text}")
+    print(f"\n{prefix}{insight_text}", file=out)
+    print(f"   Impact: {impact_text}", file=out)
+    print(f"   Recommendation: {recommendation_text}", file=out)
     if index:
-        print(f"   Priority: {priority.upper()}")
+        print(f"   Priority: {priority.upper()}", file=out)
 
 def main():
     print("🧪 Testing Insight Generator Agent")
@@ -45,21 +65,36 @@ def main():
     
     # Load performance analysis from Agent 2
     print("📥 Loading performance analysis from Agent 2...")
-    try:
-        with open('data/processed/performance_analysis.json', 'r') as f:
-            performance_analysis = json.load(f)
-        print("✅ Analysis loaded\n")
-    except FileNotFoundError:
+    analysis_path = 'data/processed/performance_analysis.json'
+    if not os.path.exists(analysis_path):
         print("❌ Error: performance_analysis.json not found!")
         print("   Please run test_agent2.py first.")
         return
+
+    # Imported after the check, so a missing input exits without loading openai/pandas
+    from src.utils.cached_io import load_json_sections_cached
+    from src.agents.insight_generator import (
+        InsightGeneratorAgent, ANALYSIS_SECTIONS, INSIGHT_CATEGORIES
+    )
+
+    performance_analysis = load_json_sections_cached(analysis_path, ANALYSIS_SECTIONS)
+    print("✅ Analysis loaded\n")
     
     # Initialize Agent 3
     agent = InsightGeneratorAgent(performance_analysis=performance_analysis)
     
-    # Run insight generation
-    print("⏳ This will take 30-60 seconds (making 5 API calls)...\n")
-    insights = agent.run()
+    # Run insight generation, unless this exact analysis was already sent
+    cache_path = _cache_path(performance_analysis)
+    if os.path.exists(cache_path):
+        print(f"♻️  Analysis unchanged, reusing cached insights: {cache_path}")
+        insights = agent.insights = orjson.loads(Path(cache_path).read_bytes())
+    else:
+        print("⏳ This will take 30-60 seconds (making 1 API call)...\n")
+        insights = agent.run()
+        # A failed call comes back empty; only cache replies worth reusing
+        if insights['metadata']['total_insights']:
+            os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+            agent.save_insights(cache_path)
     
     # Save insights
     agent.save_insights()
@@ -68,72 +103,70 @@ def main():
     print("\n" + "=" * 70)
     print("🔍 DEBUG: Checking insight structure")
     print("=" * 70)
-    for category in ['budget_efficiency', 'creative_performance', 'ad_fatigue', 'platform_insights']:
-        if insights[category] and len(insights[category]) > 0:
-            print(f"\n{category} - Keys: {list(insights[category][0].keys())}")
-    
-    # Display insights
-    print("\n" + "=" * 70)
-    print("💡 GENERATED INSIGHTS")
-    print("=" * 70)
-    
-    print("\n💰 BUDGET EFFICIENCY INSIGHTS:")
+    for category in INSIGHT_CATEGORIES:
+        category_insights = insights[category]
+        if category_insights:
+            print(f"\n{category} - Keys: {list(category_insights[0])}")
+    
+    # Display insights (buffered, written to stdout once)
+    out = io.StringIO()
+    print("\n" + "=" * 70, file=out)
+    print("💡 GENERATED INSIGHTS", file=out)
+    print("=" * 70, file=out)
+    
+    print("\n💰 BUDGET EFFICIENCY INSIGHTS:", file=out)
     if insights['budget_efficiency']:
         for i, insight in enumerate(insights['budget_efficiency'], 1):
-            print_insight_safely(insight, i)
+            print_insight_safely(insight, i, out)
     else:
-        print("   ⚠️  No budget efficiency insights generated")
+        print("   ⚠️  No budget efficiency insights generated", file=out)
     
-    print("\n🎨 CREATIVE PERFORMANCE INSIGHTS:")
+    print("\n🎨 CREATIVE PERFORMANCE INSIGHTS:", file=out)
     if insights['creative_performance']:
         for i, insight in enumerate(insights['creative_performance'], 1):
-            print_insight_safely(insight, i)
+            print_insight_safely(insight, i, out)
     else:
-        print("   ⚠️  No creative performance insights generated")
+        print("   ⚠️  No creative performance insights generated", file=out)
     
-    print("\n⏱️  AD FATIGUE INSIGHTS:")
+    print("\n⏱️  AD FATIGUE INSIGHTS:", file=out)
     if insights['ad_fatigue']:
         for i, insight in enumerate(insights['ad_fatigue'], 1):
-            print_insight_safely(insight, i)
+            print_insight_safely(insight, i, out)
     else:
-        print("   ⚠️  No ad fatigue insights generated")
+        print("   ⚠️  No ad fatigue insights generated", file=out)
     
-    print("\n📱 PLATFORM INSIGHTS:")
+    print("\n📱 PLATFORM INSIGHTS:", file=out)
     if insights['platform_insights']:
         for i, insight in enumerate(insights['platform_insights'], 1):
-            print_insight_safely(insight, i)
+            print_insight_safely(insight, i, out)
     else:
-        print("   ⚠️  No platform insights generated")
+        print("   ⚠️  No platform insights generated", file=out)
     
-    print("\n" + "=" * 70)
-    print("🎯 TOP PRIORITY RECOMMENDATIONS")
-    print("=" * 70)
+    print("\n" + "=" * 70, file=out)
+    print("🎯 TOP PRIORITY RECOMMENDATIONS", file=out)
+    print("=" * 70, file=out)
     
     if insights['priority_recommendations']:
-        for rec in insights['priority_recommendations']:
-            rank = rec.get('rank', '?')
-            insight_text = rec.get('insight', rec.get('recommendation', 'N/A'))
-            action = rec.get('recommendation', rec.get('action', 'N/A'))
-            impact = rec.get('estimated_impact', rec.get('impact', 'N/A'))
-            urgency = rec.get('urgency', 'unknown')
-            
-            print(f"\n#{rank}. {insight_text}")
-            print(f"    Action: {action}")
-            print(f"    Impact: {impact}")
-            print(f"    Urgency: {urgency.upper()}")
+        out.write(''.join(
+            _PRIORITY_TEMPLATE.format_map({
+                'rank': rec.get('rank', '?'),
+                'insight': _present_value(rec, ('insight', 'recommendation')),
+                'action': _present_value(rec, ('recommendation', 'action')),
+                'impact': _present_value(rec, ('estimated_impact', 'impact')),
+                'urgency': rec.get('urgency', 'unknown').upper(),
+            })
+            for rec in insights['priority_recommendations']
+        ))
     else:
-        print("   ⚠️  No priority recommendations generated")
+        print("   ⚠️  No priority recommendations generated", file=out)
+
+    sys.stdout.write(out.getvalue())
     
     # Summary
     print("\n" + "=" * 70)
     print("✅ Agent 3 testing complete!")
     print("=" * 70)
-    total_insights = sum([
-        len(insights['budget_efficiency']),
-        len(insights['creative_performance']),
-        len(insights['ad_fatigue']),
-        len(insights['platform_insights'])
-    ])
+    total_insights = sum(len(insights[category]) for category in INSIGHT_CATEGORIES)
     print(f"\n📊 Total insights generated: {total_insights}")
     print(f"🎯 Priority recommendations: {len(insights['priority_recommendations'])}")
     print(f"💾 Insights saved to: data/processed/insights.json")
@@ -2,8 +2,8 @@
 Test script for Dashboard Generator Agent (Agent 5) - Direct Build Approach
 """
 
-import json
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.cached_io import load_json_cached, load_parquet_cached
 
 def main():
     print("🧪 Testing Dashboard Generator Agent (Direct Build)")
@@ -12,20 +12,25 @@ def main():
     # Load all required data
     print("📥 Loading data...")
 
-    # Load processed data from agent 1
-    processed_data = pd.read_csv('data/processed/campaign_data_processed.csv')
-    processed_data['date'] = pd.to_datetime(processed_data['date'])
-    print("✅ Processed data loaded")
-
-    # Load performance analysis from Agent 2
-    with open('data/processed/performance_analysis.json', 'r') as f:
-        performance_analysis = json.load(f)
-    print("✅ Performance analysis loaded")
-
-    # Load insight from Agent 3
-    with open('data/processed/insights.json', 'r') as f:
-        insight = json.load(f)
-    print("✅ Insights loaded")
+    # pyarrow decodes Parquet without holding the GIL, so the processed data loads on
+    # a worker thread while the two JSON files parse here (orjson holds the GIL, so
+    # extra threads would not run those two in parallel)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Processed data from Agent 1
+        processed_future = executor.submit(
+            load_parquet_cached, 'data/processed/campaign_data_processed.parquet'
+        )
+
+        # Performance analysis from Agent 2
+        performance_analysis = load_json_cached('data/processed/performance_analysis.json')
+        print("✅ Performance analysis loaded")
+
+        # Insights from Agent 3
+        insight = load_json_cached('data/processed/insights.json')
+        print("✅ Insights loaded")
+
+        processed_data = processed_future.result()
+        print("✅ Processed data loaded")
 
     print("\n" + "=" * 70)
     print("✅ ALL DATA LOADED SUCCESSFULLY")